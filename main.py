@@ -12,6 +12,18 @@ A sophisticated cryptocurrency trading bot with:
 
 import os
 import sys
+
+# Optional cooperative I/O for the dashboard (SOCKETIO_ASYNC_MODE=eventlet or
+# gevent). Monkey-patching must run before anything imports socket/threading,
+# so the variable is read from the process environment, not from config/.env
+ASYNC_MODE = os.getenv('SOCKETIO_ASYNC_MODE', 'threading').lower()
+if ASYNC_MODE == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+elif ASYNC_MODE == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+
 import yaml
 import logging
 import argparse
@@ -149,7 +161,7 @@ def main():
     if args.mode in ['dashboard', 'both']:
         # Create Flask app
         print(f"{Fore.CYAN}Starting web dashboard...{Style.RESET_ALL}")
-        app, socketio = create_app(config)
+        app, socketio = create_app(config, async_mode=ASYNC_MODE)
         set_trading_bot(bot)
 
         # Get port
@@ -159,14 +171,16 @@ def main():
         print(f"{Fore.YELLOW}Open your browser and navigate to the URL above{Style.RESET_ALL}\n")
 
         if args.mode == 'both':
-            # Start bot in a separate thread
-            import threading
-            bot_thread = threading.Thread(target=bot.start)
-            bot_thread.daemon = True
-            bot_thread.start()
-
-        # Run Flask app (sans SocketIO pour éviter les crashs)
-        app.run(host='0.0.0.0', port=port, debug=False, threaded=True, use_reloader=False)
+            # Start bot as a background task of the SocketIO async mode
+            # (daemon thread, or greenlet under eventlet/gevent)
+            socketio.start_background_task(bot.start)
+
+        if ASYNC_MODE in ('eventlet', 'gevent'):
+            # Serveur WSGI coopératif: les appels HTTP bloquants ne monopolisent plus un thread
+            socketio.run(app, host='0.0.0.0', port=port, debug=False, use_reloader=False)
+        else:
+            # Run Flask app (sans SocketIO pour éviter les crashs)
+            app.run(host='0.0.0.0', port=port, debug=False, threaded=True, use_reloader=False)
 
     else:  # CLI mode
         print(f"{Fore.GREEN}Starting bot in CLI mode...{Style.RESET_ALL}")
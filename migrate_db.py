@@ -26,6 +26,7 @@ def migrate_database():
         logger.info("   - bot_sessions (session tracking)")
         logger.info("   - price_snapshots (price history)")
         logger.info("   - paper_wallet (persistent wallet)")
+        logger.info("   Timestamp indexes on trades, balances, ai_analysis, price_snapshots")
 
         # Check if wallet exists
         wallet_count = db_session.query(PaperWallet).count()
@@ -4,6 +4,8 @@ import json
 import logging
 from datetime import datetime
 
+from ..exchange.records import OHLCV
+
 logger = logging.getLogger(__name__)
 
 class MarketAnalyzer:
@@ -21,7 +23,7 @@ class MarketAnalyzer:
 
     def analyze_market(self,
                       pair: str,
-                      ohlcv_data: List[Dict],
+                      ohlcv_data: OHLCV,
                       technical_indicators: Dict,
                       order_book: Optional[Dict] = None) -> Dict:
         """
@@ -38,14 +40,14 @@ class MarketAnalyzer:
         """
         try:
             # Prepare market data summary
-            latest_candle = ohlcv_data[-1] if ohlcv_data else {}
-            recent_prices = [c['close'] for c in ohlcv_data[-20:]] if len(ohlcv_data) >= 20 else []
+            has_candles = len(ohlcv_data) > 0
+            recent_prices = ohlcv_data.close[-20:].tolist() if len(ohlcv_data) >= 20 else []
 
             market_summary = {
                 'pair': pair,
-                'current_price': latest_candle.get('close', 0),
+                'current_price': float(ohlcv_data.close[-1]) if has_candles else 0,
                 'price_change_24h': technical_indicators.get('price_change_24h', 0),
-                'volume': latest_candle.get('volume', 0),
+                'volume': float(ohlcv_data.volume[-1]) if has_candles else 0,
                 'recent_prices': recent_prices,
                 'indicators': technical_indicators
             }
@@ -3,10 +3,12 @@ import numpy as np
 from ta.trend import EMAIndicator, MACD
 from ta.momentum import RSIIndicator
 from ta.volatility import BollingerBands
-from typing import Dict, List, Tuple
+from typing import Dict, Tuple
 from enum import Enum
 import logging
 
+from ..exchange.records import OHLCV
+
 logger = logging.getLogger(__name__)
 
 class MarketContext(Enum):
@@ -28,12 +30,12 @@ class TradingStrategy:
         self.rsi_oversold = config.get('rsi_oversold', 30)
         self.rsi_overbought = config.get('rsi_overbought', 70)
 
-    def calculate_indicators(self, ohlcv_data: List[Dict]) -> Dict:
+    def calculate_indicators(self, ohlcv_data: OHLCV) -> Dict:
         """
         Calculate technical indicators from OHLCV data
 
         Args:
-            ohlcv_data: List of OHLCV candles
+            ohlcv_data: Columnar OHLCV series from the exchange client
 
         Returns:
             Dict containing calculated indicators
@@ -43,9 +45,8 @@ class TradingStrategy:
             return {}
 
         try:
-            # Convert to pandas DataFrame
-            df = pd.DataFrame(ohlcv_data)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            # Convert to pandas DataFrame (columnar, no per-candle objects)
+            df = ohlcv_data.to_frame()
             df = df.sort_values('timestamp')
 
             indicators = {}
@@ -1,10 +1,12 @@
 import time
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 from datetime import datetime
 from colorama import Fore, Style
+from sqlalchemy import case, func
 
 from ..exchange.binance_client import BinanceClient, PaperTradingClient
+from ..exchange.records import OHLCV
 from ..ai.market_analyzer import MarketAnalyzer
 from .strategy import TradingStrategy
 from .risk_manager import RiskManager
@@ -36,16 +38,19 @@ class TradingBot:
 
         # Exchange client
         mode = config['trading']['mode']
+        use_websocket = config['trading'].get('use_websocket', False)
         if mode == 'paper':
             self.exchange = PaperTradingClient(
                 initial_balance=config['trading']['initial_balance'],
-                db_session=self.db_session
+                db_session=self.db_session,
+                use_websocket=use_websocket
             )
         else:
             self.exchange = BinanceClient(
                 api_key=api_keys['binance_api_key'],
                 api_secret=api_keys['binance_api_secret'],
-                testnet=False
+                testnet=False,
+                use_websocket=use_websocket
             )
 
         # AI Analyzer (optional)
@@ -145,6 +150,10 @@ class TradingBot:
         logger.info(f"🛑 TRADING BOT STOPPED")
         logger.info(f"{'='*60}{Style.RESET_ALL}\n")
 
+        # Persist any batched paper wallet changes
+        if hasattr(self.exchange, 'flush_wallet'):
+            self.exchange.flush_wallet()
+
         # Close current session
         self._close_bot_session(reason)
 
@@ -201,7 +210,7 @@ class TradingBot:
 
         # Save price snapshot if we have an open position (for recovery analysis)
         if self.risk_manager.has_position(pair):
-            self._save_price_snapshot(pair, ticker['price'], 'periodic')
+            self._save_price_snapshot(pair, ticker.price, 'periodic')
 
         ohlcv = self.exchange.get_ohlcv(pair, timeframe='1h', limit=100)
         if not ohlcv or len(ohlcv) < 50:
@@ -227,11 +236,11 @@ class TradingBot:
 
         # Check if we have an open position
         if self.risk_manager.has_position(pair):
-            self._manage_open_position(pair, ticker['price'])
+            self._manage_open_position(pair, ticker.price)
         else:
-            self._evaluate_new_position(pair, signal, ticker['price'])
+            self._evaluate_new_position(pair, signal, ticker.price)
 
-    def _get_ai_analysis(self, pair: str, ohlcv: List[Dict], indicators: Dict) -> Optional[Dict]:
+    def _get_ai_analysis(self, pair: str, ohlcv: OHLCV, indicators: Dict) -> Optional[Dict]:
         """Get AI analysis for a pair (with caching)"""
         current_time = time.time()
         last_analysis_time = self.last_ai_analysis_time.get(pair, 0)
@@ -387,10 +396,10 @@ class TradingBot:
             market_context = signal.get('market_context', 'unknown')
 
             logger.info(f"   📊 Context: {market_context} | TP: {take_profit_percent}% | SL: {stop_loss_percent}%")
-            logger.info(f"   💰 Invested: ${trade_amount:.2f} USDT | Amount: {order['amount']:.8f} {pair.split('/')[0]}")
+            logger.info(f"   💰 Invested: ${trade_amount:.2f} USDT | Amount: {order.amount:.8f} {pair.split('/')[0]}")
 
             # Open position in risk manager with adaptive TP/SL and fees
-            amount = order['amount']
+            amount = order.amount
             position = self.risk_manager.open_position(
                 pair=pair,
                 entry_price=entry_price,
@@ -588,7 +597,7 @@ class TradingBot:
                     closed_count += 1
                     continue
 
-                current_price = ticker['price']
+                current_price = ticker.price
 
                 # Calculate current P&L to check if position should be auto-closed
                 entry_price = trade.price
@@ -665,16 +674,17 @@ class TradingBot:
         try:
             balance = self.exchange.get_balance('USDT')
 
-            # Calculate total P&L
-            trades = self.db_session.query(Trade).filter(Trade.status == 'closed').all()
-            total_profit_loss = sum(t.profit_loss for t in trades)
+            # Total P&L and winning/losing counts in one aggregate query,
+            # instead of loading every closed trade and summing it three times
+            total_trades, total_profit_loss, winning_trades, losing_trades = self.db_session.query(
+                func.count(Trade.id),
+                func.coalesce(func.sum(Trade.profit_loss), 0),
+                func.coalesce(func.sum(case((Trade.profit_loss > 0, 1), else_=0)), 0),
+                func.coalesce(func.sum(case((Trade.profit_loss < 0, 1), else_=0)), 0)
+            ).filter(Trade.status == 'closed').one()
             initial_balance = self.config['trading']['initial_balance']
             total_profit_loss_percent = (total_profit_loss / initial_balance) * 100 if initial_balance > 0 else 0
 
-            # Count winning/losing trades
-            winning_trades = sum(1 for t in trades if t.profit_loss > 0)
-            losing_trades = sum(1 for t in trades if t.profit_loss < 0)
-
             # Calculate positions value
             positions_value = sum(
                 pos['amount'] * pos.get('current_price', pos['entry_price'])
@@ -687,7 +697,7 @@ class TradingBot:
                 in_positions=positions_value,
                 total_profit_loss=total_profit_loss,
                 total_profit_loss_percent=total_profit_loss_percent,
-                total_trades=len(trades),
+                total_trades=total_trades,
                 winning_trades=winning_trades,
                 losing_trades=losing_trades
             )
@@ -829,7 +839,7 @@ class TradingBot:
                     logger.warning(f"⚠️  Could not fetch price for {pair}")
                     continue
 
-                current_price = ticker['price']
+                current_price = ticker.price
 
                 # Calculate price movement during downtime
                 entry_price = position.entry_price
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, Boolean, Text
+from sqlalchemy import create_engine, event, Index, Column, Integer, Float, String, DateTime, Boolean, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
 from datetime import datetime
@@ -9,6 +9,11 @@ Base = declarative_base()
 
 class Trade(Base):
     __tablename__ = 'trades'
+    __table_args__ = (
+        Index('ix_trade_ts', 'timestamp'),
+        Index('ix_trade_pair_ts', 'pair', 'timestamp'),
+        Index('ix_trade_status_ts', 'status', 'timestamp'),
+    )
 
     id = Column(Integer, primary_key=True)
     timestamp = Column(DateTime, default=datetime.utcnow)
@@ -43,6 +48,9 @@ class Trade(Base):
 
 class Balance(Base):
     __tablename__ = 'balances'
+    __table_args__ = (
+        Index('ix_balance_ts', 'timestamp'),
+    )
 
     id = Column(Integer, primary_key=True)
     timestamp = Column(DateTime, default=datetime.utcnow)
@@ -72,6 +80,9 @@ class Balance(Base):
 
 class AIAnalysis(Base):
     __tablename__ = 'ai_analysis'
+    __table_args__ = (
+        Index('ix_ai_analysis_ts', 'timestamp'),
+    )
 
     id = Column(Integer, primary_key=True)
     timestamp = Column(DateTime, default=datetime.utcnow)
@@ -121,6 +132,9 @@ class BotSession(Base):
 
 class PriceSnapshot(Base):
     __tablename__ = 'price_snapshots'
+    __table_args__ = (
+        Index('ix_price_snapshot_ts', 'timestamp'),
+    )
 
     id = Column(Integer, primary_key=True)
     timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -157,11 +171,26 @@ class PaperWallet(Base):
 
 # Database initialization
 engine = None
-Session = None
-_session_factory = None
+_session_factory = sessionmaker()  # bound to the engine in init_db()
+
+# Thread-local sessions for the dashboard: one per request, removed on teardown
+Session = scoped_session(_session_factory)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune every new SQLite connection for the read-heavy dashboard queries.
+
+    page_size only takes effect on a fresh database file, i.e. on the first
+    connection, before create_all() creates the tables.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA page_size=8192")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped reads
+    cursor.execute("PRAGMA cache_size=-131072")  # 128 MB page cache (negative = KiB)
+    cursor.close()
 
 def init_db(db_path='data/trading_bot.db'):
-    global engine, Session, _session_factory
+    global engine
 
     # Create data directory if it doesn't exist
     os.makedirs(os.path.dirname(db_path) if os.path.dirname(db_path) else 'data', exist_ok=True)
@@ -173,15 +202,19 @@ def init_db(db_path='data/trading_bot.db'):
         connect_args={'check_same_thread': False},
         pool_pre_ping=True  # Verify connections before using them
     )
+    event.listen(engine, 'connect', _set_sqlite_pragmas)
     Base.metadata.create_all(engine)
 
-    # Create a session factory
-    _session_factory = sessionmaker(bind=engine)
+    # create_all() skips tables that already exist: add missing indexes to
+    # databases created before they were declared
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
 
-    # Use scoped_session for thread-safe sessions
-    Session = scoped_session(_session_factory)
+    # Bind the session factory (and the scoped Session built on it)
+    _session_factory.configure(bind=engine)
 
-    return Session()
+    return _session_factory()
 
 def get_db_session():
     """
@@ -189,9 +222,7 @@ def get_db_session():
     This should be used by Flask routes to avoid database locking issues.
     Remember to close the session after use.
     """
-    global _session_factory
-
-    if _session_factory is None:
+    if engine is None:
         init_db()
 
     return _session_factory()
@@ -1,3 +1,10 @@
-from .binance_client import BinanceClient
-
 __all__ = ['BinanceClient']
+
+
+def __getattr__(name):
+    # Import the client (and ccxt with it) only when it is actually used, so
+    # importing src.exchange.records or .registry stays cheap
+    if name == 'BinanceClient':
+        from .binance_client import BinanceClient
+        return BinanceClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,32 @@
+import asyncio
 import ccxt
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 import logging
+import time
 from ..utils.retry import retry_on_failure, ConnectionManager
+from ..utils.http_session import build_http_session
+from .records import Order
+from .market_data import MarketDataMixin
+from . import registry
 
 logger = logging.getLogger(__name__)
 
-class BinanceClient:
-    def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
+# Retry transient network errors (with backoff) on authenticated REST calls
+_retry_network = retry_on_failure(
+    max_attempts=3, initial_delay=1.0,
+    exceptions=(ccxt.NetworkError, ccxt.ExchangeNotAvailable),
+    rate_limit_exceptions=(ccxt.DDoSProtection,)
+)
+
+def _to_order(order: Dict) -> Order:
+    """Map a ccxt order to our Order record"""
+    return Order(
+        order['id'], order['symbol'], order['type'], order['side'], order.get('price', 0),
+        order['amount'], order['cost'], order['filled'], order['status'], order['timestamp']
+    )
+
+class BinanceClient(MarketDataMixin):
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = True, use_websocket: bool = False):
         """
         Initialize Binance client
 
@@ -15,12 +34,14 @@ class BinanceClient:
             api_key: Binance API key
             api_secret: Binance API secret
             testnet: Use testnet (paper trading) or live trading
+            use_websocket: Serve tickers/OHLCV/order books from websocket streams
         """
         self.exchange = ccxt.binance({
             'apiKey': api_key,
             'secret': api_secret,
             'enableRateLimit': True,
             'timeout': 15000,  # 15 secondes timeout pour éviter les blocages
+            'session': build_http_session(),  # keep-alive pool, no handshake per call
             'options': {
                 'defaultType': 'spot',
                 'adjustForTimeDifference': True
@@ -31,12 +52,41 @@ class BinanceClient:
             self.exchange.set_sandbox_mode(True)
             logger.info("🧪 Binance client initialized in TESTNET mode")
         else:
+            # Reuse the already parsed live markets instead of loading them again
+            try:
+                self.exchange.set_markets(registry.shared_markets())
+            except Exception as e:
+                logger.warning(f"Could not reuse shared markets: {e}")
+            # Seeded markets skip fetch_markets(), the only place ccxt applies
+            # adjustForTimeDifference: sync the clock offset ourselves so
+            # signed calls don't fail with -1021 when the host clock drifts
+            try:
+                self.exchange.load_time_difference()
+            except Exception as e:
+                logger.warning(f"Could not sync time difference with Binance: {e}")
             logger.info("⚠️  Binance client initialized in LIVE mode")
 
         self.testnet = testnet
         self.connection_manager = ConnectionManager()
+        self._markets_loaded_at = time.monotonic() if self.exchange.markets else 0.0
+
+        # Live public data goes through the shared registry instance (same
+        # caches and connection pool as the paper client); testnet prices
+        # only exist on the sandbox endpoints
+        market_exchange = self.exchange if testnet else registry.get_exchange()
+        self._init_market_data(market_exchange, use_websocket=use_websocket, sandbox=testnet)
+
+    def _market_data_ok(self):
+        self.connection_manager.record_success()
 
-    @retry_on_failure(max_attempts=3, initial_delay=1.0, exceptions=(ccxt.NetworkError, ccxt.ExchangeNotAvailable))
+    def _market_data_error(self, error: Exception, what: str, default):
+        if isinstance(error, (ccxt.NetworkError, ccxt.ExchangeNotAvailable)):
+            # Let _retry_network retry it, then surface it to the caller
+            self.connection_manager.record_failure()
+            raise error
+        return super()._market_data_error(error, what, default)
+
+    @_retry_network
     def get_balance(self, currency: str = 'USDT') -> float:
         """Get balance for a specific currency"""
         try:
@@ -50,87 +100,30 @@ class BinanceClient:
             logger.error(f"Error fetching balance: {e}")
             return 0.0
 
-    @retry_on_failure(max_attempts=3, initial_delay=1.0, exceptions=(ccxt.NetworkError, ccxt.ExchangeNotAvailable))
-    def get_ticker(self, pair: str) -> Optional[Dict]:
-        """Get current ticker information for a pair"""
-        try:
-            ticker = self.exchange.fetch_ticker(pair)
-            self.connection_manager.record_success()
-            return {
-                'symbol': ticker['symbol'],
-                'price': ticker['last'],
-                'bid': ticker['bid'],
-                'ask': ticker['ask'],
-                'volume': ticker['quoteVolume'],
-                'change_24h': ticker['percentage'],
-                'timestamp': datetime.fromtimestamp(ticker['timestamp'] / 1000)
-            }
-        except (ccxt.NetworkError, ccxt.ExchangeNotAvailable) as e:
-            self.connection_manager.record_failure()
-            raise
-        except Exception as e:
-            logger.error(f"Error fetching ticker for {pair}: {e}")
-            return None
-
-    @retry_on_failure(max_attempts=3, initial_delay=1.0, exceptions=(ccxt.NetworkError, ccxt.ExchangeNotAvailable))
-    def get_ohlcv(self, pair: str, timeframe: str = '1h', limit: int = 100) -> List[Dict]:
-        """
-        Get OHLCV (candlestick) data
-
-        Args:
-            pair: Trading pair (e.g., 'BTC/USDT')
-            timeframe: Timeframe ('1m', '5m', '15m', '1h', '4h', '1d')
-            limit: Number of candles to fetch
-        """
-        try:
-            ohlcv = self.exchange.fetch_ohlcv(pair, timeframe, limit=limit)
-            self.connection_manager.record_success()
-            return [
-                {
-                    'timestamp': datetime.fromtimestamp(candle[0] / 1000),
-                    'open': candle[1],
-                    'high': candle[2],
-                    'low': candle[3],
-                    'close': candle[4],
-                    'volume': candle[5]
-                }
-                for candle in ohlcv
-            ]
-        except (ccxt.NetworkError, ccxt.ExchangeNotAvailable) as e:
-            self.connection_manager.record_failure()
-            raise
-        except Exception as e:
-            logger.error(f"Error fetching OHLCV for {pair}: {e}")
-            return []
+    # Same market data path as the paper client, plus network retries
+    get_ticker = _retry_network(MarketDataMixin.get_ticker)
+    get_ohlcv = _retry_network(MarketDataMixin.get_ohlcv)
 
-    def create_market_buy_order(self, pair: str, amount: float) -> Optional[Dict]:
+    def create_market_buy_order(self, pair: str, amount_usdt: float) -> Optional[Order]:
         """
         Create a market buy order
 
         Args:
             pair: Trading pair (e.g., 'BTC/USDT')
-            amount: Amount in quote currency (USDT)
+            amount_usdt: Amount of quote currency (USDT) to spend, like PaperTradingClient
         """
         try:
-            order = self.exchange.create_market_buy_order(pair, amount)
-            logger.info(f"✅ Market BUY order created: {pair} - {amount}")
-            return {
-                'id': order['id'],
-                'symbol': order['symbol'],
-                'type': order['type'],
-                'side': order['side'],
-                'price': order.get('price', 0),
-                'amount': order['amount'],
-                'cost': order['cost'],
-                'filled': order['filled'],
-                'status': order['status'],
-                'timestamp': datetime.fromtimestamp(order['timestamp'] / 1000)
-            }
+            # Sent as quoteOrderQty: Binance fills whatever base amount the USDT buys
+            order = self.exchange.create_market_buy_order_with_cost(pair, amount_usdt)
+            logger.info(f"✅ Market BUY order created: {pair} - {amount_usdt} USDT")
+            self.invalidate(pair)
+            self._notify_fill(pair)
+            return _to_order(order)
         except Exception as e:
             logger.error(f"Error creating buy order for {pair}: {e}")
             return None
 
-    def create_market_sell_order(self, pair: str, amount: float) -> Optional[Dict]:
+    def create_market_sell_order(self, pair: str, amount: float) -> Optional[Order]:
         """
         Create a market sell order
 
@@ -141,59 +134,108 @@ class BinanceClient:
         try:
             order = self.exchange.create_market_sell_order(pair, amount)
             logger.info(f"✅ Market SELL order created: {pair} - {amount}")
-            return {
-                'id': order['id'],
-                'symbol': order['symbol'],
-                'type': order['type'],
-                'side': order['side'],
-                'price': order.get('price', 0),
-                'amount': order['amount'],
-                'cost': order['cost'],
-                'filled': order['filled'],
-                'status': order['status'],
-                'timestamp': datetime.fromtimestamp(order['timestamp'] / 1000)
-            }
+            self.invalidate(pair)
+            self._notify_fill(pair)
+            return _to_order(order)
         except Exception as e:
             logger.error(f"Error creating sell order for {pair}: {e}")
             return None
 
-    def get_order_book(self, pair: str, limit: int = 20) -> Optional[Dict]:
-        """Get order book for a pair"""
-        try:
-            order_book = self.exchange.fetch_order_book(pair, limit)
-            timestamp = order_book.get('timestamp')
-            return {
-                'bids': order_book['bids'][:limit],
-                'asks': order_book['asks'][:limit],
-                'timestamp': datetime.fromtimestamp(timestamp / 1000) if timestamp else datetime.now()
+    async def create_market_buy_orders(self, orders: List[Tuple[str, float]],
+                                       concurrency: int = 10) -> List[Optional[Order]]:
+        """
+        Create several market buy orders concurrently
+
+        Args:
+            orders: (pair, amount_usdt) tuples, amounts of quote currency (USDT)
+                to spend, as in create_market_buy_order
+            concurrency: Maximum number of orders in flight at once
+
+        Returns:
+            One Order (or None on failure) per input, in the same order
+        """
+        import ccxt.async_support as ccxt_async
+
+        # aiohttp sessions are bound to the running loop, so the async client
+        # lives for one batch; it reuses the already loaded markets
+        exchange = ccxt_async.binance({
+            'apiKey': self.exchange.apiKey,
+            'secret': self.exchange.secret,
+            'enableRateLimit': True,
+            'timeout': 15000,
+            'options': {
+                'defaultType': 'spot',
+                'adjustForTimeDifference': True,
+                # set_markets() below skips fetch_markets(), which is where
+                # ccxt would measure it: reuse the sync client's clock offset
+                'timeDifference': self.exchange.options.get('timeDifference', 0)
             }
-        except Exception as e:
-            logger.error(f"Error fetching order book for {pair}: {e}")
-            return None
+        })
+        if self.testnet:
+            exchange.set_sandbox_mode(True)
+        if self.exchange.markets:
+            exchange.set_markets(self.exchange.markets)
+
+        # Stay well inside Binance's request weight budget
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def place(pair: str, amount_usdt: float) -> Optional[Order]:
+            try:
+                async with semaphore:
+                    order = await exchange.create_market_buy_order_with_cost(pair, amount_usdt)
+                logger.info(f"✅ Market BUY order created: {pair} - {amount_usdt} USDT")
+                self.invalidate(pair)
+                self._notify_fill(pair)
+                return _to_order(order)
+            except Exception as e:
+                logger.error(f"Error creating buy order for {pair}: {e}")
+                return None
+
+        try:
+            return list(await asyncio.gather(*(place(pair, amount_usdt) for pair, amount_usdt in orders)))
+        finally:
+            await exchange.close()
 
-    def get_markets(self) -> List[str]:
-        """Get list of all available trading pairs"""
+    def get_markets(self, reload: bool = False) -> List[str]:
+        """
+        Get list of all available trading pairs
+
+        Args:
+            reload: Force a fresh download (otherwise markets are reloaded at most hourly)
+        """
         try:
-            markets = self.exchange.load_markets()
-            return list(markets.keys())
+            stale = time.monotonic() - self._markets_loaded_at > registry.MARKETS_TTL
+            if reload or stale or not self.exchange.markets:
+                self.exchange.load_markets(reload=True)
+                self._markets_loaded_at = time.monotonic()
+            return list(self.exchange.markets.keys())
         except Exception as e:
             logger.error(f"Error fetching markets: {e}")
             return []
 
 
-class PaperTradingClient:
+class PaperTradingClient(MarketDataMixin):
     """Paper trading simulator - no real money involved"""
 
-    def __init__(self, initial_balance: float = 100.0, db_session=None):
+    # Every order updates the wallet rows attached to db_session, so any
+    # commit on that session (e.g. the trader saving the Trade row) persists
+    # them. Our own commits are batched: after this many orders or this many
+    # seconds since the last flush, whichever comes first
+    WALLET_FLUSH_ORDERS = 5
+    WALLET_FLUSH_INTERVAL = 0.5
+
+    def __init__(self, initial_balance: float = 100.0, db_session=None, use_websocket: bool = False):
         self.db_session = db_session
         self.positions = {}
         self.order_history = []
+        self._split_cache: Dict[str, Tuple[str, str]] = {}
+        self._wallet_rows = {}  # currency -> PaperWallet row attached to db_session
+        self._dirty_since_save = 0
+        self._last_wallet_flush = 0.0
 
-        # Créer UNE SEULE instance ccxt pour toutes les requêtes (évite fuites mémoire)
-        self.exchange = ccxt.binance({
-            'enableRateLimit': True,
-            'timeout': 15000  # 15 secondes timeout
-        })
+        # Instance ccxt publique partagée (marchés et pool HTTP communs)
+        self.exchange = registry.get_exchange()
+        self._init_market_data(self.exchange, use_websocket=use_websocket)
 
         # Load or initialize wallet from database
         self.balance = self._load_wallet_from_db(initial_balance)
@@ -204,89 +246,39 @@ class PaperTradingClient:
     def get_balance(self, currency: str = 'USDT') -> float:
         return self.balance.get(currency, 0.0)
 
-    def get_ticker(self, pair: str) -> Optional[Dict]:
-        """Get real market data even in paper trading"""
-        try:
-            ticker = self.exchange.fetch_ticker(pair)
-            return {
-                'symbol': ticker['symbol'],
-                'price': ticker['last'],
-                'bid': ticker['bid'],
-                'ask': ticker['ask'],
-                'volume': ticker['quoteVolume'],
-                'change_24h': ticker['percentage'],
-                'timestamp': datetime.fromtimestamp(ticker['timestamp'] / 1000)
-            }
-        except Exception as e:
-            logger.error(f"Error fetching ticker for {pair}: {e}")
-            return None
-
-    def get_ohlcv(self, pair: str, timeframe: str = '1h', limit: int = 100) -> List[Dict]:
-        """Get real OHLCV data even in paper trading"""
-        try:
-            ohlcv = self.exchange.fetch_ohlcv(pair, timeframe, limit=limit)
-            return [
-                {
-                    'timestamp': datetime.fromtimestamp(candle[0] / 1000),
-                    'open': candle[1],
-                    'high': candle[2],
-                    'low': candle[3],
-                    'close': candle[4],
-                    'volume': candle[5]
-                }
-                for candle in ohlcv
-            ]
-        except Exception as e:
-            logger.error(f"Error fetching OHLCV for {pair}: {e}")
-            return []
-
-    def create_market_buy_order(self, pair: str, amount_usdt: float) -> Optional[Dict]:
+    def create_market_buy_order(self, pair: str, amount_usdt: float) -> Optional[Order]:
         """Simulate a market buy order"""
         try:
             ticker = self.get_ticker(pair)
             if not ticker:
                 return None
 
-            price = ticker['ask']
+            price = ticker.ask
             amount_crypto = amount_usdt / price
 
             if self.balance.get('USDT', 0) < amount_usdt:
                 logger.warning(f"Insufficient balance for buy order: {pair}")
                 return None
 
-            # Update balances
-            self.balance['USDT'] -= amount_usdt
-            base_currency = pair.split('/')[0]
-            self.balance[base_currency] = self.balance.get(base_currency, 0) + amount_crypto
-
-            # Update positions
-            if pair not in self.positions:
-                self.positions[pair] = {
-                    'amount': 0,
-                    'avg_price': 0,
-                    'total_cost': 0
-                }
-
-            pos = self.positions[pair]
-            pos['total_cost'] += amount_usdt
-            pos['amount'] += amount_crypto
-            pos['avg_price'] = pos['total_cost'] / pos['amount']
-
-            order = {
-                'id': f"paper_{len(self.order_history) + 1}",
-                'symbol': pair,
-                'type': 'market',
-                'side': 'buy',
-                'price': price,
-                'amount': amount_crypto,
-                'cost': amount_usdt,
-                'filled': amount_crypto,
-                'status': 'closed',
-                'timestamp': datetime.now()
-            }
+            base_currency = self._base(pair)
+            self._apply_buy(pair, base_currency, amount_crypto, amount_usdt)
+
+            order = Order(
+                id=f"paper_{len(self.order_history) + 1}",
+                symbol=pair,
+                type='market',
+                side='buy',
+                price=price,
+                amount=amount_crypto,
+                cost=amount_usdt,
+                filled=amount_crypto,
+                status='closed',
+                timestamp_ms=int(time.time() * 1000)
+            )
 
             self.order_history.append(order)
             logger.info(f"📄 Paper BUY: {amount_crypto:.6f} {base_currency} at {price:.2f} USDT")
+            self._notify_fill(pair)
 
             # Save wallet to database
             self._save_wallet_to_db()
@@ -297,15 +289,33 @@ class PaperTradingClient:
             logger.error(f"Error in paper buy order: {e}")
             return None
 
-    def create_market_sell_order(self, pair: str, amount: float) -> Optional[Dict]:
+    async def create_market_buy_orders(self, orders: List[Tuple[str, float]],
+                                       concurrency: int = 10) -> List[Optional[Order]]:
+        """
+        Simulate several market buy orders (same interface as BinanceClient)
+
+        Args:
+            orders: (pair, amount_usdt) tuples, amounts of quote currency (USDT)
+                to spend, as in create_market_buy_order
+
+        Fills are simulated in memory, so only the price lookup goes to the
+        network: one batched ticker request for all pairs, then the orders
+        are applied in sequence against the wallet.
+        """
+        pairs = list(dict.fromkeys(pair for pair, _ in orders))
+        await asyncio.to_thread(self.get_tickers, pairs)
+
+        return [self.create_market_buy_order(pair, amount_usdt) for pair, amount_usdt in orders]
+
+    def create_market_sell_order(self, pair: str, amount: float) -> Optional[Order]:
         """Simulate a market sell order"""
         try:
             ticker = self.get_ticker(pair)
             if not ticker:
                 return None
 
-            price = ticker['bid']
-            base_currency = pair.split('/')[0]
+            price = ticker.bid
+            base_currency = self._base(pair)
 
             if self.balance.get(base_currency, 0) < amount:
                 logger.warning(f"Insufficient {base_currency} for sell order")
@@ -313,34 +323,24 @@ class PaperTradingClient:
 
             amount_usdt = amount * price
 
-            # Update balances
-            self.balance[base_currency] -= amount
-            self.balance['USDT'] = self.balance.get('USDT', 0) + amount_usdt
-
-            # Update positions
-            if pair in self.positions:
-                pos = self.positions[pair]
-                pos['amount'] -= amount
-                pos['total_cost'] -= (amount * pos['avg_price'])
-
-                if pos['amount'] <= 0:
-                    del self.positions[pair]
-
-            order = {
-                'id': f"paper_{len(self.order_history) + 1}",
-                'symbol': pair,
-                'type': 'market',
-                'side': 'sell',
-                'price': price,
-                'amount': amount,
-                'cost': amount_usdt,
-                'filled': amount,
-                'status': 'closed',
-                'timestamp': datetime.now()
-            }
+            self._apply_sell(pair, base_currency, amount, amount_usdt)
+
+            order = Order(
+                id=f"paper_{len(self.order_history) + 1}",
+                symbol=pair,
+                type='market',
+                side='sell',
+                price=price,
+                amount=amount,
+                cost=amount_usdt,
+                filled=amount,
+                status='closed',
+                timestamp_ms=int(time.time() * 1000)
+            )
 
             self.order_history.append(order)
             logger.info(f"📄 Paper SELL: {amount:.6f} {base_currency} at {price:.2f} USDT")
+            self._notify_fill(pair)
 
             # Save wallet to database
             self._save_wallet_to_db()
@@ -351,6 +351,49 @@ class PaperTradingClient:
             logger.error(f"Error in paper sell order: {e}")
             return None
 
+    def _base(self, pair: str) -> str:
+        """Base currency of a pair, memoized to avoid a split per order"""
+        try:
+            return self._split_cache[pair][0]
+        except KeyError:
+            base, _, quote = pair.partition('/')
+            self._split_cache[pair] = (base, quote)
+            return base
+
+    def _apply_buy(self, pair: str, base_currency: str, amount_crypto: float, amount_usdt: float):
+        """Apply a simulated buy fill to balances and positions (pure arithmetic, no I/O)"""
+        balance = self.balance
+        balance['USDT'] -= amount_usdt
+        balance[base_currency] = balance.get(base_currency, 0) + amount_crypto
+
+        pos = self.positions.get(pair)
+        if pos is None:
+            self.positions[pair] = {
+                'amount': amount_crypto,
+                'avg_price': amount_usdt / amount_crypto,
+                'total_cost': amount_usdt
+            }
+            return
+
+        pos['total_cost'] += amount_usdt
+        pos['amount'] += amount_crypto
+        pos['avg_price'] = pos['total_cost'] / pos['amount']
+
+    def _apply_sell(self, pair: str, base_currency: str, amount: float, amount_usdt: float):
+        """Apply a simulated sell fill to balances and positions (pure arithmetic, no I/O)"""
+        balance = self.balance
+        balance[base_currency] -= amount
+        balance['USDT'] = balance.get('USDT', 0) + amount_usdt
+
+        pos = self.positions.get(pair)
+        if pos is None:
+            return
+
+        pos['amount'] -= amount
+        pos['total_cost'] -= amount * pos['avg_price']
+        if pos['amount'] <= 0:
+            del self.positions[pair]
+
     def _load_wallet_from_db(self, initial_balance: float) -> Dict[str, float]:
         """Load wallet state from database or initialize it"""
         from ..database.models import PaperWallet
@@ -376,10 +419,12 @@ class PaperTradingClient:
                 self.db_session.add(usdt_entry)
                 self.db_session.commit()
                 wallet['USDT'] = initial_balance
+                self._wallet_rows['USDT'] = usdt_entry
             else:
                 # Load existing wallet
                 for entry in wallet_entries:
                     wallet[entry.currency] = entry.balance
+                    self._wallet_rows[entry.currency] = entry
 
                 logger.info(f"💰 Loaded paper wallet from database:")
                 for currency, balance in wallet.items():
@@ -398,37 +443,62 @@ class PaperTradingClient:
             return {'USDT': initial_balance}
 
     def _save_wallet_to_db(self):
-        """Save current wallet state to database"""
+        """Record a wallet change, flushing bursts of orders in a single commit"""
+        if not self.db_session:
+            return
+
+        self._dirty_since_save += 1
+        elapsed = time.monotonic() - self._last_wallet_flush
+        if self._dirty_since_save >= self.WALLET_FLUSH_ORDERS or elapsed >= self.WALLET_FLUSH_INTERVAL:
+            self.flush_wallet()
+        else:
+            try:
+                self._stage_wallet()
+            except Exception as e:
+                logger.error(f"Error staging wallet changes: {e}")
+
+    def _stage_wallet(self):
+        """Copy the in-memory balances onto the session's wallet rows (no commit)"""
         from ..database.models import PaperWallet
 
-        if not self.db_session:
+        for currency, balance in self.balance.items():
+            entry = self._wallet_rows.get(currency)
+            if entry is None:
+                # Keep new rows attached too, so later saves just mutate them
+                entry = PaperWallet(
+                    currency=currency,
+                    balance=balance,
+                    initial_balance=0.0  # Only USDT has initial balance set
+                )
+                self._wallet_rows[currency] = entry
+            else:
+                # Row already attached to the session: no SELECT needed
+                entry.balance = balance
+            if entry not in self.db_session:
+                # New row, or a pending insert expunged by a rollback
+                self.db_session.add(entry)
+
+    def flush_wallet(self):
+        """Save pending wallet changes to database in a single commit"""
+        from ..database.models import PaperWallet
+
+        if not self.db_session or not self._dirty_since_save:
             return
 
         try:
-            for currency, balance in self.balance.items():
-                # Check if entry exists
-                entry = self.db_session.query(PaperWallet).filter(
-                    PaperWallet.currency == currency
-                ).first()
-
-                if entry:
-                    # Update existing entry
-                    entry.balance = balance
-                else:
-                    # Create new entry
-                    entry = PaperWallet(
-                        currency=currency,
-                        balance=balance,
-                        initial_balance=0.0  # Only USDT has initial balance set
-                    )
-                    self.db_session.add(entry)
-
+            self._stage_wallet()
             self.db_session.commit()
+            self._dirty_since_save = 0
+            self._last_wallet_flush = time.monotonic()
 
         except Exception as e:
             logger.error(f"Error saving wallet to database: {e}")
             try:
                 self.db_session.rollback()
+                # Rolled-back inserts are detached: re-resolve rows from the database
+                self._wallet_rows = {
+                    entry.currency: entry for entry in self.db_session.query(PaperWallet).all()
+                }
             except:
                 pass
 
@@ -436,30 +506,19 @@ class PaperTradingClient:
         """Calculate total wallet value in USDT"""
         total = self.balance.get('USDT', 0.0)
 
-        for currency, amount in self.balance.items():
-            if currency == 'USDT' or amount == 0:
-                continue
-
-            try:
-                pair = f"{currency}/USDT"
-                ticker = self.get_ticker(pair)
-                if ticker:
-                    total += amount * ticker['price']
-            except:
-                pass
+        holdings = {
+            f"{currency}/USDT": amount
+            for currency, amount in self.balance.items()
+            if currency != 'USDT' and amount != 0
+        }
+        if not holdings:
+            return total
+
+        # One batched request for all holdings instead of one fetch_ticker each
+        tickers = self.get_tickers(list(holdings))
+        for pair, amount in holdings.items():
+            ticker = tickers.get(pair)
+            if ticker and ticker.price is not None:
+                total += amount * ticker.price
 
         return total
-
-    def get_order_book(self, pair: str, limit: int = 20) -> Optional[Dict]:
-        """Get real order book data"""
-        try:
-            order_book = self.exchange.fetch_order_book(pair, limit)
-            timestamp = order_book.get('timestamp')
-            return {
-                'bids': order_book['bids'][:limit],
-                'asks': order_book['asks'][:limit],
-                'timestamp': datetime.fromtimestamp(timestamp / 1000) if timestamp else datetime.now()
-            }
-        except Exception as e:
-            logger.error(f"Error fetching order book for {pair}: {e}")
-            return None
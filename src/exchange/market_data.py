@@ -0,0 +1,210 @@
+"""
+Public market data (tickers, candles, order books) shared by the clients.
+
+BinanceClient and PaperTradingClient both inherit MarketDataMixin. Clients
+reading from the same ccxt handle - the registry's public instance, in
+live and paper mode - also share the ticker / order book caches and the
+websocket subscriptions, so a price fetched by one is a cache hit for the
+other.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from ..utils.cache import TTLCache
+from .records import Ticker, OHLCV
+from .stream import MarketStream
+
+logger = logging.getLogger(__name__)
+
+
+def _to_ticker(ticker: Dict) -> Ticker:
+    """Map a ccxt ticker to our Ticker record"""
+    return Ticker(
+        ticker['symbol'], ticker['last'], ticker['bid'], ticker['ask'],
+        ticker['quoteVolume'], ticker['percentage'], ticker['timestamp']
+    )
+
+
+class _SharedMarketState:
+    """Caches and websocket feed attached to one ccxt handle"""
+
+    def __init__(self, exchange):
+        self.exchange = exchange  # keeps id(exchange) from being reused
+        # Collapse repeated get_ticker() calls within the same strategy pass
+        self.ticker_cache = TTLCache(maxsize=256, ttl=0.5)
+        self.order_book_cache = TTLCache(maxsize=128, ttl=0.5)
+        self.stream: Optional[MarketStream] = None
+
+
+# Fan-out for per-pair fallbacks: N requests in flight instead of N in a row
+_fanout = ThreadPoolExecutor(max_workers=8, thread_name_prefix='market-data')
+
+_states: Dict[int, _SharedMarketState] = {}
+_states_lock = threading.Lock()
+
+
+def _shared_state(exchange, use_websocket: bool, sandbox: bool) -> _SharedMarketState:
+    with _states_lock:
+        state = _states.get(id(exchange))
+        if state is None:
+            state = _states[id(exchange)] = _SharedMarketState(exchange)
+        if use_websocket and state.stream is None:
+            # Optional push-based market data (falls back to REST when stale)
+            state.stream = MarketStream(sandbox=sandbox)
+        return state
+
+
+class MarketDataMixin:
+    """
+    get_ticker / get_ohlcv / get_order_book on top of ``market_exchange``.
+
+    Subclasses call _init_market_data() from __init__ and may override the
+    _market_data_ok / _market_data_error hooks to track connection health.
+    """
+
+    def _init_market_data(self, market_exchange, use_websocket: bool = False, sandbox: bool = False):
+        state = _shared_state(market_exchange, use_websocket, sandbox)
+        self.market_exchange = market_exchange
+        self.stream = state.stream
+        self._ticker_cache = state.ticker_cache
+        self._order_book_cache = state.order_book_cache
+        self._fill_listeners: List[Callable[[str], None]] = []
+
+    def _market_data_ok(self):
+        """Called after each successful fetch"""
+
+    def _market_data_error(self, error: Exception, what: str, default):
+        """Called when a fetch fails; returns the value handed to the caller"""
+        logger.error(f"Error fetching {what}: {error}")
+        return default
+
+    def invalidate(self, pair: Optional[str] = None):
+        """Drop the cached ticker for a pair (or all pairs) so the next read is fresh"""
+        self._ticker_cache.invalidate(pair)
+
+    def add_fill_listener(self, callback: Callable[[str], None]):
+        """Call ``callback(pair)`` after each order fill, e.g. to drop downstream caches"""
+        self._fill_listeners.append(callback)
+
+    def _notify_fill(self, pair: str):
+        for callback in self._fill_listeners:
+            try:
+                callback(pair)
+            except Exception as e:
+                logger.warning(f"Fill listener failed for {pair}: {e}")
+
+    def get_ticker(self, pair: str) -> Optional[Ticker]:
+        """Get current ticker information for a pair"""
+        cached = self._ticker_cache.get(pair)
+        if cached is not None:
+            return cached
+
+        try:
+            ticker = self.stream.ticker(pair) if self.stream else None
+            if ticker is None:
+                ticker = self.market_exchange.fetch_ticker(pair)
+                if self.stream:
+                    self.stream.subscribe_ticker(pair)
+            self._market_data_ok()
+            result = _to_ticker(ticker)
+            self._ticker_cache.set(pair, result)
+            return result
+        except Exception as e:
+            return self._market_data_error(e, f"ticker for {pair}", None)
+
+    def get_tickers(self, pairs: List[str]) -> Dict[str, Ticker]:
+        """
+        Get tickers for several pairs with at most one request
+
+        Cached (or streamed) pairs are served locally; the rest come from a
+        single fetch_tickers() call, which also primes the ticker cache.
+        Pairs without a ticker are missing from the result.
+        """
+        result = {}
+        missing = []
+        for pair in pairs:
+            cached = self._ticker_cache.get(pair)
+            if cached is None and self.stream:
+                streamed = self.stream.ticker(pair)
+                if streamed is not None:
+                    cached = _to_ticker(streamed)
+                    self._ticker_cache.set(pair, cached)
+            if cached is not None:
+                result[pair] = cached
+            else:
+                missing.append(pair)
+
+        if not missing:
+            return result
+
+        try:
+            tickers = self.market_exchange.fetch_tickers(missing)
+            self._market_data_ok()
+        except Exception as e:
+            import ccxt  # already loaded: market_exchange is a ccxt client
+
+            if not isinstance(e, ccxt.BadSymbol):
+                # Network error, rate limit...: N single requests would only
+                # add load, so report it and serve what was cached
+                return self._market_data_error(e, f"tickers for {len(missing)} pairs", result)
+
+            # One delisted symbol rejects the whole batch: price pair by pair
+            logger.warning(f"Batch ticker fetch failed, fetching {len(missing)} pairs individually: {e}")
+            for pair, ticker in zip(missing, _fanout.map(self.get_ticker, missing)):
+                if ticker:
+                    result[pair] = ticker
+            return result
+
+        for pair, ticker in tickers.items():
+            try:
+                record = _to_ticker(ticker)
+            except (KeyError, TypeError):
+                continue
+            self._ticker_cache.set(pair, record)
+            result[pair] = record
+        return result
+
+    def get_ohlcv(self, pair: str, timeframe: str = '1h', limit: int = 100) -> OHLCV:
+        """
+        Get OHLCV (candlestick) data
+
+        Args:
+            pair: Trading pair (e.g., 'BTC/USDT')
+            timeframe: Timeframe ('1m', '5m', '15m', '1h', '4h', '1d')
+            limit: Number of candles to fetch
+        """
+        try:
+            ohlcv = self.stream.ohlcv(pair, timeframe, limit) if self.stream else None
+            if ohlcv is None:
+                ohlcv = self.market_exchange.fetch_ohlcv(pair, timeframe, limit=limit)
+                if self.stream:
+                    self.stream.seed_ohlcv(pair, timeframe, limit, ohlcv)
+            self._market_data_ok()
+            return OHLCV.from_ccxt(ohlcv)
+        except Exception as e:
+            return self._market_data_error(e, f"OHLCV for {pair}", OHLCV.from_ccxt([]))
+
+    def get_order_book(self, pair: str, limit: int = 20) -> Optional[Dict]:
+        """Get order book data"""
+        cached = self._order_book_cache.get((pair, limit))
+        if cached is not None:
+            return cached
+
+        try:
+            order_book = self.stream.order_book(pair, limit) if self.stream else None
+            if order_book is not None:
+                return order_book
+            if self.stream:
+                self.stream.subscribe_order_book(pair, limit)
+
+            # ccxt already trims the book to `limit` and parses it into
+            # {'bids', 'asks', 'timestamp' (ms), ...}; hand it over as-is
+            order_book = self.market_exchange.fetch_order_book(pair, limit)
+            self._order_book_cache.set((pair, limit), order_book)
+            return order_book
+        except Exception as e:
+            logger.error(f"Error fetching order book for {pair}: {e}")
+            return None
@@ -0,0 +1,139 @@
+"""
+Compact, immutable records returned by the exchange clients.
+
+Records are NamedTuples: one tuple allocation per record and C-level
+attribute access, instead of a 7-10 key dict per ticker / candle / order.
+Callers use attribute access (``ticker.price``); ``_asdict()`` gives the
+JSON-ready mapping.
+
+Timestamps are kept as the exchange's integer milliseconds; the
+``timestamp`` property only builds a datetime when a caller asks for one.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterator, List, NamedTuple, Optional, Union
+
+import numpy as np
+
+
+class Ticker(NamedTuple):
+    symbol: str
+    price: float
+    bid: float
+    ask: float
+    volume: float
+    change_24h: float
+    timestamp_ms: int
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ms / 1000)
+
+
+class Candle(NamedTuple):
+    timestamp_ms: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ms / 1000)
+
+
+class Order(NamedTuple):
+    id: str
+    symbol: str
+    type: str
+    side: str
+    price: Optional[float]
+    amount: float
+    cost: float
+    filled: float
+    status: str
+    timestamp_ms: int
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ms / 1000)
+
+
+_RECORD_FIELDS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+
+class OHLCV:
+    """
+    Columnar candle series backed by NumPy arrays.
+
+    Built from ccxt's list-of-lists with a single np.asarray call instead of
+    one dict (and one datetime) per candle. Indexing or iterating yields
+    Candle rows lazily for callers that work row by row; to_frame() hands
+    the columns to pandas without going through Python objects.
+    """
+
+    __slots__ = ('timestamp_ms', 'open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, timestamp_ms: np.ndarray, open: np.ndarray, high: np.ndarray,
+                 low: np.ndarray, close: np.ndarray, volume: np.ndarray):
+        self.timestamp_ms = timestamp_ms
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    @classmethod
+    def from_ccxt(cls, ohlcv: List[List]) -> 'OHLCV':
+        """Build from ccxt rows [timestamp_ms, open, high, low, close, volume]"""
+        arr = np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+        return cls(arr[:, 0].astype(np.int64), arr[:, 1], arr[:, 2], arr[:, 3], arr[:, 4], arr[:, 5])
+
+    def __len__(self) -> int:
+        return len(self.timestamp_ms)
+
+    def _row(self, i: int) -> Candle:
+        return Candle(
+            int(self.timestamp_ms[i]),
+            float(self.open[i]), float(self.high[i]), float(self.low[i]),
+            float(self.close[i]), float(self.volume[i])
+        )
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Candle, 'OHLCV']:
+        if isinstance(index, slice):
+            return OHLCV(self.timestamp_ms[index], self.open[index], self.high[index],
+                         self.low[index], self.close[index], self.volume[index])
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Candle]:
+        # One tolist() per column converts to Python floats in C
+        for ts, o, h, l, c, v in zip(self.timestamp_ms.tolist(), self.open.tolist(), self.high.tolist(),
+                                     self.low.tolist(), self.close.tolist(), self.volume.tolist()):
+            yield Candle(ts, o, h, l, c, v)
+
+    def to_records(self) -> List[Dict]:
+        """
+        Return JSON-ready rows {'timestamp', 'open', 'high', 'low', 'close', 'volume'}
+
+        Columns are converted with one tolist() each and zipped straight into
+        dicts, without a Candle per row. Timestamps are naive local datetimes,
+        like Candle.timestamp, so they line up with the trade timestamps.
+        """
+        timestamps = map(datetime.fromtimestamp, (self.timestamp_ms / 1000).tolist())
+        rows = zip(timestamps, self.open.tolist(), self.high.tolist(),
+                   self.low.tolist(), self.close.tolist(), self.volume.tolist())
+        return [dict(zip(_RECORD_FIELDS, row)) for row in rows]
+
+    def to_frame(self):
+        """Return a pandas DataFrame with a datetime64 'timestamp' column"""
+        import pandas as pd
+
+        return pd.DataFrame({
+            'timestamp': pd.to_datetime(self.timestamp_ms, unit='ms'),
+            'open': self.open,
+            'high': self.high,
+            'low': self.low,
+            'close': self.close,
+            'volume': self.volume
+        })
@@ -0,0 +1,99 @@
+"""
+Process-wide public Binance client and market metadata.
+
+PaperTradingClient and the market_utils helpers all read public market
+data, so they share one ccxt instance (one keep-alive connection pool) and
+one parsed copy of the ~3000 Binance markets. Authenticated clients keep
+their own instance but can reuse the markets via set_markets().
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict
+
+from ..utils.cache import CACHE_DIR
+from ..utils.http_session import build_http_session
+
+logger = logging.getLogger(__name__)
+
+# Binance markets change rarely: reload them at most once per hour and keep
+# a copy on disk for fast cold starts. Plain JSON (never pickle: loading it
+# can't run code)
+MARKETS_TTL = 3600
+MARKETS_CACHE_PATH = os.path.join(CACHE_DIR, 'binance_markets.json')
+
+_instance = None
+_markets = None
+_markets_loaded_at = 0.0
+_lock = threading.RLock()
+
+
+def get_exchange():
+    """Return the shared public Binance client, with markets loaded"""
+    global _instance
+
+    if _instance is None:
+        with _lock:
+            if _instance is None:
+                # Deferred: importing ccxt loads every exchange module, which
+                # callers that never touch the network shouldn't pay for
+                import ccxt
+
+                _instance = ccxt.binance({
+                    'enableRateLimit': True,
+                    'timeout': 15000,
+                    'session': build_http_session()
+                })
+                try:
+                    shared_markets()
+                except Exception as e:
+                    # ccxt loads markets lazily on the first call anyway
+                    logger.warning(f"Could not preload Binance markets: {e}")
+
+    return _instance
+
+
+def shared_markets() -> Dict:
+    """
+    Return Binance markets from memory, disk or the API (in that order).
+
+    The lock makes concurrent callers wait for a single load_markets()
+    instead of all downloading the markets at once.
+    """
+    global _markets, _markets_loaded_at
+
+    with _lock:
+        exchange = get_exchange()
+        now = time.time()
+
+        if _markets is not None and now - _markets_loaded_at <= MARKETS_TTL:
+            return _markets
+
+        try:
+            if os.path.exists(MARKETS_CACHE_PATH):
+                mtime = os.path.getmtime(MARKETS_CACHE_PATH)
+                if now - mtime < MARKETS_TTL:
+                    with open(MARKETS_CACHE_PATH, 'r') as f:
+                        _markets = json.load(f)
+                    _markets_loaded_at = mtime
+                    exchange.set_markets(_markets)
+                    return _markets
+        except Exception as e:
+            logger.warning(f"Could not read markets cache, reloading: {e}")
+
+        _markets = exchange.load_markets(reload=_markets is not None)
+        _markets_loaded_at = now
+
+        try:
+            os.makedirs(os.path.dirname(MARKETS_CACHE_PATH), exist_ok=True)
+            tmp_path = f"{MARKETS_CACHE_PATH}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(_markets, f)
+            os.replace(tmp_path, MARKETS_CACHE_PATH)
+        except Exception as e:
+            logger.warning(f"Could not write markets cache: {e}")
+
+        return _markets
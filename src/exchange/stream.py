@@ -0,0 +1,160 @@
+"""
+WebSocket market data feed (ccxt.pro) for the synchronous exchange clients.
+
+The feed runs an asyncio loop in a background thread. Each subscribed
+pair gets a watch task that keeps the latest ticker / candles / order book
+in memory, so the clients' getters can answer from the last pushed
+snapshot instead of doing a REST round-trip.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class MarketStream:
+    """Background websocket subscriptions with a synchronous read API"""
+
+    def __init__(self, config: Optional[Dict] = None, sandbox: bool = False, max_age: float = 10.0):
+        """
+        Args:
+            config: ccxt exchange config (keys are not needed for market data)
+            sandbox: Connect to the Binance testnet streams
+            max_age: Seconds after which a snapshot is considered stale
+        """
+        self.max_age = max_age
+        self._config = dict(config or {})
+        self._sandbox = sandbox
+
+        self._tickers = {}    # pair -> (ticker, received_at)
+        self._ohlcv = {}      # (pair, timeframe) -> [deque of candles, received_at]
+        self._books = {}      # pair -> (order_book, received_at, depth)
+        self._subscriptions = set()
+        self._lock = threading.Lock()
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='market-stream', daemon=True)
+        self._thread.start()
+        self._exchange = asyncio.run_coroutine_threadsafe(self._create_exchange(), self._loop).result()
+        logger.info("📡 WebSocket market stream started")
+
+    async def _create_exchange(self):
+        import ccxt.pro as ccxtpro
+
+        exchange = ccxtpro.binance(self._config)
+        if self._sandbox:
+            exchange.set_sandbox_mode(True)
+        return exchange
+
+    def _subscribe(self, key, coro_factory):
+        with self._lock:
+            if key in self._subscriptions:
+                return
+            self._subscriptions.add(key)
+        asyncio.run_coroutine_threadsafe(self._watch(key, coro_factory), self._loop)
+
+    async def _watch(self, key, coro_factory):
+        while key in self._subscriptions:
+            try:
+                await coro_factory()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"WebSocket stream {key} error: {e} - reconnecting in 5s")
+                await asyncio.sleep(5)
+
+    def _is_fresh(self, received_at: float) -> bool:
+        return time.monotonic() - received_at < self.max_age
+
+    # Tickers
+
+    def subscribe_ticker(self, pair: str):
+        async def update():
+            ticker = await self._exchange.watch_ticker(pair)
+            self._tickers[pair] = (ticker, time.monotonic())
+
+        self._subscribe(('ticker', pair), update)
+
+    def ticker(self, pair: str) -> Optional[Dict]:
+        """Latest pushed ccxt ticker, or None if not subscribed yet or stale"""
+        entry = self._tickers.get(pair)
+        if entry and self._is_fresh(entry[1]):
+            return entry[0]
+        return None
+
+    # Candles
+
+    def seed_ohlcv(self, pair: str, timeframe: str, limit: int, ohlcv: List[List]):
+        """
+        Prime the candle buffer with REST history and start streaming.
+
+        The kline stream only pushes the current candle, so the history has
+        to come from one initial fetch_ohlcv call.
+        """
+        key = (pair, timeframe)
+        self._ohlcv[key] = [deque(ohlcv, maxlen=limit), time.monotonic()]
+
+        async def update():
+            candles = await self._exchange.watch_ohlcv(pair, timeframe)
+            buffer = self._ohlcv[key][0]
+            for candle in candles:
+                if buffer and candle[0] == buffer[-1][0]:
+                    buffer[-1] = candle
+                elif not buffer or candle[0] > buffer[-1][0]:
+                    buffer.append(candle)
+            self._ohlcv[key][1] = time.monotonic()
+
+        self._subscribe(('ohlcv', pair, timeframe), update)
+
+    def ohlcv(self, pair: str, timeframe: str, limit: int) -> Optional[List[List]]:
+        """Latest `limit` candles, or None if the buffer is missing, short or stale"""
+        entry = self._ohlcv.get((pair, timeframe))
+        if not entry or not self._is_fresh(entry[1]):
+            return None
+
+        buffer = entry[0]
+        if buffer.maxlen < limit:
+            return None
+        candles = list(buffer)
+        return candles[-limit:]
+
+    # Order books
+
+    def subscribe_order_book(self, pair: str, limit: int):
+        async def update():
+            book = await self._exchange.watch_order_book(pair, limit)
+            # ccxt.pro mutates its book in place; keep a snapshot copy
+            self._books[pair] = ({
+                'bids': book['bids'][:limit],
+                'asks': book['asks'][:limit],
+                'timestamp': book.get('timestamp'),
+                'symbol': pair
+            }, time.monotonic(), limit)
+
+        self._subscribe(('book', pair), update)
+
+    def order_book(self, pair: str, limit: int) -> Optional[Dict]:
+        """Latest pushed order book, or None if not subscribed yet or stale"""
+        entry = self._books.get(pair)
+        if not entry or not self._is_fresh(entry[1]) or entry[2] < limit:
+            return None
+
+        book = entry[0]
+        return {**book, 'bids': book['bids'][:limit], 'asks': book['asks'][:limit]}
+
+    def close(self):
+        """Stop all subscriptions and the background loop"""
+        with self._lock:
+            self._subscriptions.clear()
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._exchange.close(), self._loop).result(timeout=5)
+        except Exception as e:
+            logger.warning(f"Error closing WebSocket stream: {e}")
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
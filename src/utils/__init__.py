@@ -1,3 +1,10 @@
-from .market_utils import get_top_pairs
-
 __all__ = ['get_top_pairs']
+
+
+def __getattr__(name):
+    # Resolved lazily: market_utils imports the exchange registry, which in
+    # turn imports helpers from this package
+    if name == 'get_top_pairs':
+        from .market_utils import get_top_pairs
+        return get_top_pairs
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,97 @@
+"""
+Small thread-safe TTL cache for exchange data.
+"""
+
+import os
+import time
+import threading
+from typing import Any, Callable, Hashable
+
+# On-disk caches (markets, top pairs) live under the project directory,
+# whatever the working directory the bot is started from
+CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), '.cache'
+)
+
+
+class TTLCache:
+    """
+    Bounded key/value cache whose entries expire after ``ttl`` seconds.
+
+    Safe to share between the trading loop and the dashboard threads.
+    When full, expired entries are dropped first, then the oldest ones.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 1.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+        self._computing = {}  # key -> lock held by the caller filling it
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value for ttl seconds"""
+        with self._lock:
+            now = time.monotonic()
+            self._data.pop(key, None)
+
+            if len(self._data) >= self.maxsize:
+                for k in [k for k, (_, exp) in self._data.items() if exp <= now]:
+                    del self._data[k]
+                while len(self._data) >= self.maxsize:
+                    del self._data[next(iter(self._data))]
+
+            self._data[key] = (value, now + self.ttl)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value, calling compute() to fill it on a miss.
+
+        Concurrent misses on the same key are coalesced (single flight): one
+        caller runs compute() while the others wait and reuse its result,
+        instead of all hitting the exchange when the entry expires. Falsy
+        results (None, empty data) are returned but not cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            key_lock = self._computing.setdefault(key, threading.Lock())
+
+        with key_lock:
+            value = self.get(key)  # filled while we were waiting
+            if value is None:
+                try:
+                    value = compute()
+                    if value:
+                        self.set(key, value)
+                finally:
+                    with self._lock:
+                        self._computing.pop(key, None)
+            return value
+
+    def invalidate(self, key: Hashable = None):
+        """Drop one key, or everything if no key is given"""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,52 @@
+"""
+Keep-alive HTTP session shared by the ccxt clients.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
+
+
+class _DroppedConnectionRetry(Retry):
+    """
+    Retry connection failures and dropped connections, never read timeouts.
+
+    urllib3 counts both a server closing the socket mid-request
+    (RemoteDisconnected / ProtocolError) and a read timeout as read errors;
+    only the former is worth an immediate retry.
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if isinstance(error, ReadTimeoutError):
+            raise error.with_traceback(_stacktrace)
+        return super().increment(method, url, response=response, error=error,
+                                 _pool=_pool, _stacktrace=_stacktrace)
+
+
+def build_http_session(pool_connections: int = 4, pool_maxsize: int = 32) -> requests.Session:
+    """
+    Build a requests session with a bounded keep-alive connection pool.
+
+    Passed to ccxt as its ``session`` so consecutive fetch_* calls reuse the
+    same TCP/TLS connection instead of paying a new handshake each time.
+
+    Reads (GET, never order placement or cancellation) get two quick retries
+    when the connection fails or is dropped, e.g. a pooled connection the
+    server closes as the request goes out: better replaced on the spot than
+    surfaced to the retry_on_failure decorators with their multi-second
+    backoff. Read timeouts and HTTP error statuses are not retried here (a
+    timed-out request would otherwise block for several timeouts inside each
+    decorator attempt).
+
+    Args:
+        pool_connections: Number of hosts to keep pools for
+        pool_maxsize: Maximum connections kept alive per host
+    """
+    session = requests.Session()
+    retries = _DroppedConnectionRetry(total=2, connect=2, read=2, status=0, backoff_factor=0.1,
+                                      raise_on_status=False, allowed_methods=frozenset({'GET', 'HEAD'}))
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retries)
+    session.mount('https://', adapter)
+    session.headers.update({'Connection': 'keep-alive'})
+    return session
@@ -1,58 +1,110 @@
-import ccxt
+import heapq
+import json
 import logging
+import os
+import time
+from operator import itemgetter
 from typing import List, Tuple
 
+from ..exchange.registry import get_exchange, shared_markets
+from .cache import CACHE_DIR
+
 logger = logging.getLogger(__name__)
 
-def get_top_pairs(limit: int = 10, quote_currency: str = 'USDT') -> List[str]:
+# Stablecoins à exclure (frozenset: test d'appartenance en O(1))
+STABLECOINS = frozenset({'USDC', 'USDT', 'BUSD', 'TUSD', 'FDUSD', 'DAI', 'USDP', 'USDD', 'USDK'})
+
+# Le classement par volume bouge lentement: cache disque de 10 minutes
+TOP_PAIRS_TTL = 600
+TOP_PAIRS_CACHE_DIR = CACHE_DIR
+
+
+def _top_pairs_cache_path(quote_currency: str, limit: int) -> str:
+    return os.path.join(TOP_PAIRS_CACHE_DIR, f"top_pairs_{quote_currency}_{limit}.json")
+
+
+def _read_top_pairs_cache(path: str):
+    """Retourne les paires en cache si le fichier a moins de TOP_PAIRS_TTL secondes"""
+    try:
+        if os.path.getmtime(path) > time.time() - TOP_PAIRS_TTL:
+            with open(path, 'r') as f:
+                return json.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Cache top paires illisible, recalcul: {e}")
+    return None
+
+
+def _write_top_pairs_cache(path: str, pairs: List[str]):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(pairs, f)
+        os.replace(tmp_path, path)  # écriture atomique
+    except Exception as e:
+        logger.warning(f"Impossible d'écrire le cache top paires: {e}")
+
+def get_top_pairs(limit: int = 10, quote_currency: str = 'USDT', force_refresh: bool = False) -> List[str]:
     """
     Récupère les top N paires par volume sur Binance
 
     Args:
         limit: Nombre de paires à récupérer (défaut: 10)
         quote_currency: Devise de cotation (défaut: USDT)
+        force_refresh: Ignorer le cache disque de 10 minutes
 
     Returns:
         Liste des paires (ex: ['BTC/USDT', 'ETH/USDT', ...])
     """
-    try:
-        exchange = ccxt.binance({'enableRateLimit': True})
+    cache_path = _top_pairs_cache_path(quote_currency, limit)
+    if not force_refresh:
+        cached = _read_top_pairs_cache(cache_path)
+        if cached:
+            logger.info(f"✅ Top {limit} paires chargées depuis le cache: {', '.join(cached)}")
+            return cached
 
-        # Charger tous les marchés
-        markets = exchange.load_markets()
+    try:
+        exchange = get_exchange()
 
-        # Liste des stablecoins à exclure
-        stablecoins = ['USDC', 'USDT', 'BUSD', 'TUSD', 'FDUSD', 'DAI', 'USDP', 'USDD', 'USDK']
+        # Marchés partagés (cache mémoire/disque, rechargés toutes les heures)
+        markets = shared_markets()
 
         # Filtrer pour ne garder que les paires USDT actives (sans stablecoins)
-        usdt_pairs = [
+        usdt_pairs = frozenset(
             symbol for symbol, market in markets.items()
             if market['quote'] == quote_currency
             and market['active']
             and market['spot']  # Seulement le spot trading
-            and market['base'] not in stablecoins  # Exclure les stablecoins
-        ]
+            and market['base'] not in STABLECOINS  # Exclure les stablecoins
+        )
 
-        # Récupérer les tickers pour avoir le volume
+        # Tous les tickers en une seule requête (pas de liste de symboles
+        # dans l'URL), filtrés ensuite côté client
         logger.info(f"Récupération du volume pour {len(usdt_pairs)} paires...")
-        tickers = exchange.fetch_tickers(usdt_pairs)
-
-        # Trier par volume (quoteVolume = volume en USDT)
-        pairs_with_volume = []
-        for symbol, ticker in tickers.items():
-            if ticker.get('quoteVolume'):
-                pairs_with_volume.append((symbol, ticker['quoteVolume']))
-
-        # Trier par volume décroissant
-        pairs_with_volume.sort(key=lambda x: x[1], reverse=True)
-
-        # Prendre le top N
-        top_pairs = [pair[0] for pair in pairs_with_volume[:limit]]
+        tickers = exchange.fetch_tickers()
+
+        # Top N par volume (quoteVolume = volume en USDT) en une seule passe:
+        # tas de taille N au lieu d'un tri complet, O(n log N)
+        top_with_volume = heapq.nlargest(
+            limit,
+            (
+                (symbol, ticker['quoteVolume'])
+                for symbol, ticker in tickers.items()
+                if symbol in usdt_pairs and ticker.get('quoteVolume')
+            ),
+            key=itemgetter(1)
+        )
+        top_pairs = [pair for pair, _ in top_with_volume]
 
         logger.info(f"✅ Top {limit} paires récupérées:")
-        for i, (pair, volume) in enumerate(pairs_with_volume[:limit], 1):
+        for i, (pair, volume) in enumerate(top_with_volume, 1):
             logger.info(f"   {i}. {pair} - Volume: ${volume:,.0f}")
 
+        if top_pairs:
+            _write_top_pairs_cache(cache_path, top_pairs)
+
         return top_pairs
 
     except Exception as e:
@@ -68,30 +120,25 @@ def get_top_pairs_info(limit: int = 10) -> List[Tuple[str, float, float]]:
         Liste de tuples (symbol, volume, price)
     """
     try:
-        exchange = ccxt.binance({'enableRateLimit': True})
-        markets = exchange.load_markets()
+        exchange = get_exchange()
+        markets = shared_markets()
 
-        usdt_pairs = [
+        usdt_pairs = frozenset(
             symbol for symbol, market in markets.items()
             if market['quote'] == 'USDT'
             and market['active']
             and market['spot']
-        ]
-
-        tickers = exchange.fetch_tickers(usdt_pairs)
+        )
 
-        pairs_info = []
-        for symbol, ticker in tickers.items():
-            if ticker.get('quoteVolume') and ticker.get('last'):
-                pairs_info.append((
-                    symbol,
-                    ticker['quoteVolume'],
-                    ticker['last']
-                ))
+        tickers = exchange.fetch_tickers()
 
-        pairs_info.sort(key=lambda x: x[1], reverse=True)
+        pairs_info = (
+            (symbol, ticker['quoteVolume'], ticker['last'])
+            for symbol, ticker in tickers.items()
+            if symbol in usdt_pairs and ticker.get('quoteVolume') and ticker.get('last')
+        )
 
-        return pairs_info[:limit]
+        return heapq.nlargest(limit, pairs_info, key=itemgetter(1))
 
     except Exception as e:
         logger.error(f"Erreur: {e}")
@@ -2,20 +2,35 @@
 Retry mechanism for API calls with exponential backoff.
 """
 
+import re
 import time
+import random
 import logging
-from functools import wraps
-from typing import Callable, Any, Tuple, Type
+import threading
+from functools import lru_cache, wraps
+from typing import Callable, Any, Optional, Tuple, Type
 
 logger = logging.getLogger(__name__)
 
+_RETRY_AFTER_RE = re.compile(r'retry[-_ ]after["\']?\s*[:=]?\s*(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+
+def _parse_retry_after(error: Exception) -> Optional[float]:
+    """Extract a Retry-After value (seconds) from an exception message, if present"""
+    if not error.args:
+        return None
+    match = _RETRY_AFTER_RE.search(str(error.args[0]))
+    return float(match.group(1)) if match else None
+
 
 def retry_on_failure(
     max_attempts: int = 3,
     initial_delay: float = 1.0,
     backoff_factor: float = 2.0,
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
-    on_retry: Callable[[int, Exception], None] = None
+    on_retry: Callable[[int, Exception], None] = None,
+    jitter: bool = True,
+    rate_limit_exceptions: Tuple[Type[Exception], ...] = ()
 ):
     """
     Decorator to retry a function call with exponential backoff on failure.
@@ -26,6 +41,10 @@ def retry_on_failure(
         backoff_factor: Multiplier for delay after each retry (default: 2.0)
         exceptions: Tuple of exception types to catch and retry (default: all exceptions)
         on_retry: Optional callback function called on each retry with (attempt_number, exception)
+        jitter: Sleep a random duration between half and the full delay, so concurrent
+            callers don't retry in lock-step (default: True)
+        rate_limit_exceptions: Exception types whose message may carry a Retry-After
+            value; when present, the wait is at least that long
 
     Example:
         @retry_on_failure(max_attempts=3, initial_delay=2.0)
@@ -33,9 +52,11 @@ def retry_on_failure(
             return api.get_data()
     """
     def decorator(func: Callable) -> Callable:
+        # Backoff schedule computed once per decorated function
+        delays = tuple(initial_delay * backoff_factor ** i for i in range(max(max_attempts - 1, 0)))
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            delay = initial_delay
             last_exception = None
 
             for attempt in range(1, max_attempts + 1):
@@ -53,6 +74,13 @@ def retry_on_failure(
                     logger.warning(
                         f"⚠️  Attempt {attempt}/{max_attempts} failed for {func.__name__}(): {str(e)}"
                     )
+                    delay = delays[attempt - 1]
+                    if jitter:
+                        delay = delay / 2 + random.random() * delay / 2
+                    if rate_limit_exceptions and isinstance(e, rate_limit_exceptions):
+                        retry_after = _parse_retry_after(e)
+                        if retry_after is not None:
+                            delay = max(retry_after, delay)
                     logger.info(f"   Retrying in {delay:.1f} seconds...")
 
                     # Call the on_retry callback if provided
@@ -63,7 +91,6 @@ def retry_on_failure(
                             logger.error(f"Error in retry callback: {callback_error}")
 
                     time.sleep(delay)
-                    delay *= backoff_factor
 
             # Should never reach here, but just in case
             if last_exception:
@@ -91,14 +118,16 @@ def retry_with_timeout(
         exceptions: Tuple of exception types to catch and retry (default: all exceptions)
     """
     def decorator(func: Callable) -> Callable:
+        delays = tuple(initial_delay * backoff_factor ** i for i in range(max(max_attempts - 1, 0)))
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            start_time = time.time()
-            delay = initial_delay
+            # Monotonic clock: elapsed time is not affected by NTP adjustments
+            start_time = time.monotonic()
             last_exception = None
 
             for attempt in range(1, max_attempts + 1):
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
 
                 if elapsed >= timeout:
                     logger.error(f"❌ Timeout reached ({timeout}s) for {func.__name__}()")
@@ -117,6 +146,8 @@ def retry_with_timeout(
                         )
                         raise
 
+                    delay = delays[attempt - 1]
+
                     # Check if we have time for another attempt
                     if elapsed + delay >= timeout:
                         logger.error(f"❌ No time left for retry (timeout: {timeout}s)")
@@ -128,7 +159,6 @@ def retry_with_timeout(
                     logger.info(f"   Retrying in {delay:.1f} seconds...")
 
                     time.sleep(delay)
-                    delay *= backoff_factor
 
             # Should never reach here, but just in case
             if last_exception:
@@ -138,6 +168,12 @@ def retry_with_timeout(
     return decorator
 
 
+@lru_cache(maxsize=8)
+def _wait_table(base_wait: float, max_wait: float, size: int = 32) -> Tuple[float, ...]:
+    """Capped exponential wait times, indexed by failure count - 1"""
+    return tuple(min(base_wait * (2 ** i), max_wait) for i in range(size))
+
+
 class ConnectionManager:
     """
     Manager for handling connection state and retry logic.
@@ -147,21 +183,31 @@ class ConnectionManager:
         self.connection_failures = 0
         self.last_failure_time = None
         self.is_connected = True
+        # The client is shared by the trading loop and the dashboard threads
+        self._lock = threading.Lock()
 
     def record_failure(self):
         """Record a connection failure"""
-        self.connection_failures += 1
-        self.last_failure_time = time.time()
-        self.is_connected = False
-        logger.warning(f"Connection failure recorded (total: {self.connection_failures})")
+        with self._lock:
+            self.connection_failures += 1
+            self.last_failure_time = time.time()
+            self.is_connected = False
+            failures = self.connection_failures
+        logger.warning(f"Connection failure recorded (total: {failures})")
 
     def record_success(self):
         """Record a successful connection"""
-        if not self.is_connected:
+        # Fast path: nothing to reset on the usual successful call
+        if self.is_connected and self.connection_failures == 0:
+            return
+
+        with self._lock:
+            restored = not self.is_connected
+            self.connection_failures = 0
+            self.last_failure_time = None
+            self.is_connected = True
+        if restored:
             logger.info("✅ Connection restored")
-        self.connection_failures = 0
-        self.last_failure_time = None
-        self.is_connected = True
 
     def should_retry(self, max_failures: int = 5) -> bool:
         """Check if we should retry based on failure count"""
@@ -172,5 +218,5 @@ class ConnectionManager:
         if self.connection_failures == 0:
             return 0
 
-        wait_time = base_wait * (2 ** (self.connection_failures - 1))
-        return min(wait_time, max_wait)
+        table = _wait_table(base_wait, max_wait)
+        return table[min(self.connection_failures, len(table)) - 1]
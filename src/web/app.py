@@ -1,28 +1,319 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request, stream_with_context
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
-import threading
+from flask_compress import Compress
+import hashlib
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import wraps
+import numpy as np
+from sqlalchemy import bindparam, case, func, select
 
-from ..database.models import init_db, get_db_session, Trade, Balance, AIAnalysis
+from ..database.models import init_db, Session, Trade, Balance, AIAnalysis
+from ..utils.cache import TTLCache
+from .json_provider import OrjsonProvider, stream_json_array
 
 logger = logging.getLogger(__name__)
 
 # Global bot instance (will be set from main.py)
 trading_bot = None
 
-def create_app(config):
-    """Create Flask application"""
+# Caches partagés par tous les endpoints: plusieurs onglets du dashboard qui
+# interrogent la même paire ne déclenchent qu'un seul appel à l'exchange
+_ticker_cache = TTLCache(maxsize=256, ttl=2)
+_ohlcv_cache = TTLCache(maxsize=128, ttl=30)
+_overview_cache = TTLCache(maxsize=1, ttl=10)
+# Marqueurs d'entrée/sortie du graphique, indexés par (paire, version des
+# trades de la paire): un ordre exécuté ou une position clôturée change la
+# version, donc jamais de marqueurs périmés même avant le commit du trader
+_markers_cache = TTLCache(maxsize=64, ttl=60)
+
+# Requêtes des endpoints construites une fois à l'import: chaque appel ne
+# fait que lier ses paramètres. Colonnes seules: des tuples Row au lieu
+# d'objets ORM complets (pas d'identity map ni d'instrumentation par ligne),
+# avec les mêmes clés que Trade.to_dict() / AIAnalysis.to_dict()
+_TRADES_STMT = select(
+    Trade.id, Trade.timestamp, Trade.pair, Trade.side, Trade.amount, Trade.price,
+    Trade.total, Trade.profit_loss, Trade.profit_loss_percent, Trade.status,
+    Trade.strategy, Trade.ai_confidence, Trade.notes
+).order_by(Trade.timestamp.desc()).limit(bindparam('limit'))
+
+# Changes on every new trade and on every close (status + P&L update)
+_TRADES_VERSION_STMT = select(
+    func.count(Trade.id),
+    func.max(Trade.id),
+    func.sum(case((Trade.status == 'closed', 1), else_=0)),
+    func.sum(Trade.profit_loss)
+)
+
+_CHART_TRADES_STMT = select(
+    Trade.timestamp, Trade.side, Trade.price, Trade.amount, Trade.status,
+    Trade.profit_loss, Trade.profit_loss_percent
+).where(Trade.pair == bindparam('pair')).order_by(Trade.timestamp.asc())
+
+# Same fingerprint as _TRADES_VERSION_STMT, for one pair (ix_trade_pair_ts)
+_CHART_TRADES_VERSION_STMT = select(
+    func.count(Trade.id),
+    func.max(Trade.id),
+    func.sum(case((Trade.status == 'closed', 1), else_=0)),
+    func.sum(Trade.profit_loss)
+).where(Trade.pair == bindparam('pair'))
+
+_ANALYSES_STMT = select(
+    AIAnalysis.id, AIAnalysis.timestamp, AIAnalysis.pair, AIAnalysis.recommendation,
+    AIAnalysis.confidence, AIAnalysis.reasoning
+).order_by(AIAnalysis.timestamp.desc()).limit(bindparam('limit'))
+
+_LATEST_ANALYSIS_ID_STMT = select(func.max(AIAnalysis.id))
+
+_LATEST_BALANCE_STMT = select(Balance).order_by(Balance.timestamp.desc()).limit(1)
+
+_LATEST_BALANCE_ID_STMT = select(func.max(Balance.id))
+
+# Trade metrics aggregated in SQL: one row back instead of every trade
+_is_win = Trade.profit_loss > 0
+_is_loss = Trade.profit_loss < 0
+_TRADE_METRICS_STMT = select(
+    func.count(Trade.id),
+    func.coalesce(func.sum(case((_is_win, 1), else_=0)), 0),
+    func.coalesce(func.sum(case((_is_loss, 1), else_=0)), 0),
+    func.coalesce(func.sum(case((_is_win, Trade.profit_loss), else_=0)), 0),
+    func.coalesce(func.sum(case((_is_loss, -Trade.profit_loss), else_=0)), 0)
+).where(Trade.timestamp >= bindparam('since'), Trade.status == 'closed')
+
+_BALANCE_HISTORY_STMT = select(
+    Balance.timestamp, Balance.total_balance
+).where(Balance.timestamp >= bindparam('since')).order_by(Balance.timestamp.asc())
+
+# Balance history window: rows enter (max id) and age out (count, min id)
+_BALANCE_WINDOW_VERSION_STMT = select(
+    func.count(Balance.id), func.min(Balance.id), func.max(Balance.id)
+).where(Balance.timestamp >= bindparam('since'))
+
+# P&L live recalculé au plus une fois par seconde, quel que soit le nombre
+# d'onglets qui interrogent /api/live_pnl
+PNL_REFRESH_INTERVAL = 1
+_latest_pnl = None  # (time.monotonic(), snapshot)
+
+# Appels exchange indépendants d'une même requête lancés en parallèle
+_io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='dashboard-io')
+
+
+def _get_ticker(pair):
+    return _ticker_cache.get_or_compute(pair, lambda: trading_bot.exchange.get_ticker(pair))
+
+
+def _get_tickers(pairs):
+    tickers = {}
+    missing = []
+    for pair in pairs:
+        ticker = _ticker_cache.get(pair)
+        if ticker is None:
+            missing.append(pair)
+        else:
+            tickers[pair] = ticker
+
+    if missing:
+        for pair, ticker in trading_bot.exchange.get_tickers(missing).items():
+            _ticker_cache.set(pair, ticker)
+            tickers[pair] = ticker
+    return tickers
+
+
+def _get_ohlcv(pair, timeframe, limit):
+    return _ohlcv_cache.get_or_compute(
+        (pair, timeframe, limit),
+        lambda: trading_bot.exchange.get_ohlcv(pair, timeframe=timeframe, limit=limit)
+    )
+
+
+def _conditional_response(version, build):
+    """
+    Answer 304 Not Modified when the client already has this version of the data.
+
+    ``version`` is a tuple of cheap aggregates (row count, max id...) that
+    changes whenever the payload would; build() makes the full response
+    only when it did. Cache-Control: no-cache makes the browser revalidate
+    each poll, so dashboard fetch() calls get 304s while nothing changed.
+
+    The ETag is weak so it stays valid across content encodings (a strong
+    one gets an ':br' / ':gzip' suffix from Flask-Compress).
+    """
+    etag = hashlib.md5(repr((request.full_path, version)).encode()).hexdigest()
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = build()
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def _trade_marker(trade):
+    """Chart marker for a trade row (entry for buys, exit for sells)"""
+    if trade.side == 'buy':
+        return {
+            'type': 'entry',
+            'timestamp': trade.timestamp,
+            'price': trade.price,
+            'amount': trade.amount,
+            'status': trade.status
+        }
+    if trade.side == 'sell':
+        return {
+            'type': 'exit',
+            'timestamp': trade.timestamp,
+            'price': trade.price,
+            'amount': trade.amount,
+            'profit_loss': trade.profit_loss,
+            'profit_loss_percent': trade.profit_loss_percent
+        }
+    return None
+
+
+def _get_trade_markers(pair):
+    db = Session()
+    version = tuple(db.execute(_CHART_TRADES_VERSION_STMT, {'pair': pair}).one())
+
+    def build():
+        # Get all trades for this pair (both open and closed)
+        trades = db.execute(_CHART_TRADES_STMT, {'pair': pair}).all()
+        markers = [_trade_marker(trade) for trade in trades]
+        return [marker for marker in markers if marker]
+
+    return _markers_cache.get_or_compute((pair, version), build)
+
+
+def _build_market_overview():
+    pairs = trading_bot.pairs
+    overview = []
+
+    # Un seul appel fetch_tickers pour toutes les paires
+    tickers = _get_tickers(pairs)
+    for pair in pairs:
+        ticker = tickers.get(pair)
+        if ticker:
+            overview.append({
+                'pair': pair,
+                'price': ticker.price,
+                'change_24h': ticker.change_24h or 0
+            })
+    return overview
+
+
+def invalidate_market_cache(pair=None):
+    """Drop cached dashboard market data for a pair (or everything) after a fill"""
+    global _latest_pnl
+    _latest_pnl = None  # positions changed: next /api/live_pnl recomputes
+    _ticker_cache.invalidate(pair)
+    _overview_cache.invalidate()
+    if pair is None:
+        _ohlcv_cache.invalidate()
+
+
+def _compute_live_pnl():
+    """Live P&L of the open positions, priced with one batched ticker fetch"""
+    positions = trading_bot.risk_manager.get_open_positions()
+    position_count = len(positions)
+    if not position_count:
+        return {'total_pnl': 0, 'total_pnl_percent': 0, 'position_count': 0, 'positions': []}
+
+    # Fetch REAL-TIME prices from exchange in one batched request
+    try:
+        tickers = _get_tickers([pos['pair'] for pos in positions])
+    except Exception as e:
+        logger.warning(f"Could not fetch real-time prices: {e}")
+        tickers = {}
+
+    def current_price(pos):
+        ticker = tickers.get(pos['pair'])
+        if ticker and ticker.price:
+            return ticker.price
+        return pos.get('current_price', pos['entry_price'])
+
+    # Recalculate P&L with real-time prices, all positions at once
+    entry = np.fromiter((pos['entry_price'] for pos in positions), dtype=np.float64, count=position_count)
+    amount = np.fromiter((pos['amount'] for pos in positions), dtype=np.float64, count=position_count)
+    current = np.fromiter(map(current_price, positions), dtype=np.float64, count=position_count)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pnl = (current - entry) * amount
+        pnl_percent = (current / entry - 1) * 100
+
+    # entry_price à 0: garder le P&L enregistré par le risk manager
+    for i in np.flatnonzero(~np.isfinite(pnl_percent)).tolist():
+        logger.warning(f"Invalid entry price for {positions[i]['pair']}, using stored P&L")
+        pnl[i] = positions[i]['profit_loss']
+        pnl_percent[i] = positions[i]['profit_loss_percent']
+
+    positions_data = [
+        {
+            'pair': pos['pair'],
+            'entry_price': pos['entry_price'],
+            'current_price': price,
+            'amount': pos['amount'],
+            'profit_loss': profit_loss,
+            'profit_loss_percent': profit_loss_percent,
+            'stop_loss': pos.get('stop_loss'),
+            'take_profit': pos.get('take_profit')
+        }
+        for pos, price, profit_loss, profit_loss_percent
+        in zip(positions, current.tolist(), pnl.tolist(), pnl_percent.tolist())
+    ]
+
+    return {
+        'total_pnl': float(pnl.sum()),
+        'total_pnl_percent': float(pnl_percent.mean()),
+        'position_count': position_count,
+        'positions': positions_data
+    }
+
+
+def _refresh_live_pnl():
+    global _latest_pnl
+    snapshot = _compute_live_pnl()
+    _latest_pnl = (time.monotonic(), snapshot)
+    return snapshot
+
+
+def _get_live_pnl():
+    """Latest P&L snapshot, recomputed if older than PNL_REFRESH_INTERVAL"""
+    latest = _latest_pnl
+    if latest is not None and time.monotonic() - latest[0] < PNL_REFRESH_INTERVAL:
+        return latest[1]
+    return _refresh_live_pnl()
+
+
+def create_app(config, async_mode='threading'):
+    """
+    Create Flask application
+
+    Args:
+        config: Bot configuration
+        async_mode: Flask-SocketIO async mode ('threading', 'eventlet' or 'gevent');
+            eventlet/gevent require the stdlib to be monkey-patched first (see main.py)
+    """
     app = Flask(__name__)
     app.config['SECRET_KEY'] = config.get('flask_secret_key', 'dev-secret-key')
+    app.json = OrjsonProvider(app)
+
+    # JSON du dashboard (clés répétées, timestamps ISO) compressé ~5-8x;
+    # les petites réponses (< 500 octets) partent telles quelles
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app)
 
     CORS(app)
-    socketio = SocketIO(app, cors_allowed_origins="*")
+    socketio = SocketIO(app, cors_allowed_origins="*", async_mode=async_mode)
 
     # Initialize database (creates tables if needed)
-    init_db()
+    init_db().close()
+
+    @app.teardown_appcontext
+    def remove_db_session(exc=None):
+        """Close the request's DB session (rolls back anything left uncommitted)"""
+        Session.remove()
 
     @app.route('/')
     def index():
@@ -41,48 +332,56 @@ def create_app(config):
     @app.route('/api/balance')
     def get_balance():
         """Get current balance and P&L"""
-        db = get_db_session()
+        db = Session()
         try:
-            latest_balance = db.query(Balance).order_by(
-                Balance.timestamp.desc()
-            ).first()
+            # Balance rows are append-only: the latest id identifies the answer
+            latest_id = db.execute(_LATEST_BALANCE_ID_STMT).scalar()
+
+            def build():
+                latest_balance = db.execute(_LATEST_BALANCE_STMT).scalar()
+
+                if not latest_balance:
+                    return jsonify({
+                        'total_balance': 0,
+                        'available_balance': 0,
+                        'in_positions': 0,
+                        'total_profit_loss': 0,
+                        'total_profit_loss_percent': 0,
+                        'total_trades': 0,
+                        'winning_trades': 0,
+                        'losing_trades': 0,
+                        'win_rate': 0
+                    })
 
-            if not latest_balance:
-                return jsonify({
-                    'total_balance': 0,
-                    'available_balance': 0,
-                    'in_positions': 0,
-                    'total_profit_loss': 0,
-                    'total_profit_loss_percent': 0,
-                    'total_trades': 0,
-                    'winning_trades': 0,
-                    'losing_trades': 0,
-                    'win_rate': 0
-                })
+                return jsonify(latest_balance.to_dict())
 
-            return jsonify(latest_balance.to_dict())
+            return _conditional_response(latest_id, build)
         except Exception as e:
             logger.error(f"Error fetching balance: {e}")
             return jsonify({'error': str(e)}), 500
-        finally:
-            db.close()
 
     @app.route('/api/trades')
     def get_trades():
         """Get recent trades"""
-        db = get_db_session()
+        db = Session()
         try:
             limit = request.args.get('limit', 20, type=int)
-            trades = db.query(Trade).order_by(
-                Trade.timestamp.desc()
-            ).limit(limit).all()
 
-            return jsonify([trade.to_dict() for trade in trades])
+            def build():
+                # Lignes lues et encodées par paquets: la mémoire ne dépend pas de limit
+                trades = db.execute(
+                    _TRADES_STMT, {'limit': limit}, execution_options={'yield_per': 100}
+                )
+
+                return Response(
+                    stream_with_context(stream_json_array(trades, chunk_size=100)),
+                    mimetype='application/json'
+                )
+
+            return _conditional_response(tuple(db.execute(_TRADES_VERSION_STMT).one()), build)
         except Exception as e:
             logger.error(f"Error fetching trades: {e}")
             return jsonify({'error': str(e)}), 500
-        finally:
-            db.close()
 
     @app.route('/api/positions')
     def get_positions():
@@ -92,12 +391,18 @@ def create_app(config):
 
         positions = trading_bot.risk_manager.get_open_positions()
 
-        # Update positions with REAL-TIME prices
+        # Update positions with REAL-TIME prices (one batched ticker request)
+        try:
+            tickers = _get_tickers([pos['pair'] for pos in positions])
+        except Exception as e:
+            logger.warning(f"Could not fetch real-time prices: {e}")
+            tickers = {}
+
         for pos in positions:
             try:
-                ticker = trading_bot.exchange.get_ticker(pos['pair'])
+                ticker = tickers.get(pos['pair'])
                 if ticker:
-                    current_price = ticker['price']
+                    current_price = ticker.price
                     pos['current_price'] = current_price
 
                     # Recalculate P&L with real-time price
@@ -116,69 +421,59 @@ def create_app(config):
     @app.route('/api/ai_analysis')
     def get_ai_analysis():
         """Get recent AI analysis"""
-        db = get_db_session()
+        db = Session()
         try:
             limit = request.args.get('limit', 10, type=int)
-            analyses = db.query(AIAnalysis).order_by(
-                AIAnalysis.timestamp.desc()
-            ).limit(limit).all()
 
-            return jsonify([analysis.to_dict() for analysis in analyses])
+            def build():
+                analyses = db.execute(_ANALYSES_STMT, {'limit': limit}).all()
+                return jsonify([analysis._asdict() for analysis in analyses])
+
+            # AI analyses are append-only
+            return _conditional_response(db.execute(_LATEST_ANALYSIS_ID_STMT).scalar(), build)
         except Exception as e:
             logger.error(f"Error fetching AI analysis: {e}")
             return jsonify({'error': str(e)}), 500
-        finally:
-            db.close()
 
     @app.route('/api/performance')
     def get_performance():
         """Get performance metrics"""
-        db = get_db_session()
+        db = Session()
         try:
-            # Get balance history for the last 24 hours
-            since = datetime.now() - timedelta(hours=24)
-            balances = db.query(Balance).filter(
-                Balance.timestamp >= since
-            ).order_by(Balance.timestamp.asc()).all()
-
-            # Get trades history
-            trades = db.query(Trade).filter(
-                Trade.timestamp >= since,
-                Trade.status == 'closed'
-            ).all()
-
-            # Calculate metrics
-            total_trades = len(trades)
-            winning_trades = sum(1 for t in trades if t.profit_loss > 0)
-            losing_trades = sum(1 for t in trades if t.profit_loss < 0)
-            total_profit = sum(t.profit_loss for t in trades if t.profit_loss > 0)
-            total_loss = sum(abs(t.profit_loss) for t in trades if t.profit_loss < 0)
+            params = {'since': datetime.now() - timedelta(hours=24)}
 
-            return jsonify({
-                'balance_history': [
-                    {
-                        'timestamp': b.timestamp.isoformat(),
-                        'balance': b.total_balance
-                    }
-                    for b in balances
-                ],
-                'total_trades': total_trades,
-                'winning_trades': winning_trades,
-                'losing_trades': losing_trades,
-                'win_rate': (winning_trades / total_trades * 100) if total_trades > 0 else 0,
-                'total_profit': total_profit,
-                'total_loss': total_loss,
-                'profit_factor': (total_profit / total_loss) if total_loss > 0 else 0
-            })
+            total_trades, winning_trades, losing_trades, total_profit, total_loss = db.execute(
+                _TRADE_METRICS_STMT, params
+            ).one()
+            balances_version = db.execute(_BALANCE_WINDOW_VERSION_STMT, params).one()
+
+            def build():
+                # Get balance history for the last 24 hours
+                balances = db.execute(_BALANCE_HISTORY_STMT, params).all()
+
+                return jsonify({
+                    'balance_history': [
+                        {
+                            'timestamp': b.timestamp,
+                            'balance': b.total_balance
+                        }
+                        for b in balances
+                    ],
+                    'total_trades': total_trades,
+                    'winning_trades': winning_trades,
+                    'losing_trades': losing_trades,
+                    'win_rate': (winning_trades / total_trades * 100) if total_trades > 0 else 0,
+                    'total_profit': total_profit,
+                    'total_loss': total_loss,
+                    'profit_factor': (total_profit / total_loss) if total_loss > 0 else 0
+                })
+
+            version = (total_trades, winning_trades, losing_trades, total_profit, total_loss,
+                       tuple(balances_version))
+            return _conditional_response(version, build)
         except Exception as e:
             logger.error(f"Error fetching performance: {e}")
             return jsonify({'error': str(e)}), 500
-        finally:
-            db.close()
-
-    # Cache pour market overview
-    market_overview_cache = {'data': None, 'timestamp': 0}
-    CACHE_DURATION = 10  # 10 secondes
 
     @app.route('/api/market_overview')
     def get_market_overview():
@@ -187,33 +482,9 @@ def create_app(config):
             return jsonify({'error': 'Bot not initialized'}), 500
 
         try:
-            import time
-            current_time = time.time()
-
-            # Utiliser le cache si valide
-            if market_overview_cache['data'] and (current_time - market_overview_cache['timestamp'] < CACHE_DURATION):
-                return jsonify(market_overview_cache['data'])
-
-            pairs = trading_bot.pairs
-            overview = []
-
-            for pair in pairs:
-                try:
-                    ticker = trading_bot.exchange.get_ticker(pair)
-                    if ticker:
-                        overview.append({
-                            'pair': pair,
-                            'price': ticker['price'],
-                            'change_24h': ticker.get('change_24h', 0)
-                        })
-                except Exception as e:
-                    logger.warning(f"Could not fetch ticker for {pair}: {e}")
-                    continue
-
-            # Mettre en cache
-            market_overview_cache['data'] = overview
-            market_overview_cache['timestamp'] = current_time
-
+            # Cache de 10 secondes; à l'expiration, une seule requête le
+            # reconstruit pendant que les autres attendent son résultat
+            overview = _overview_cache.get_or_compute('overview', _build_market_overview)
             return jsonify(overview)
         except Exception as e:
             logger.error(f"Error fetching market overview: {e}")
@@ -226,22 +497,14 @@ def create_app(config):
             return jsonify({'error': 'Bot not initialized'}), 500
 
         try:
-            ticker = trading_bot.exchange.get_ticker(pair)
-            ohlcv = trading_bot.exchange.get_ohlcv(pair, timeframe='1h', limit=24)
+            # Ticker et bougies en parallèle: max(RTT) au lieu de la somme
+            ticker_future = _io_pool.submit(_get_ticker, pair)
+            ohlcv = _get_ohlcv(pair, '1h', 24)
+            ticker = ticker_future.result()
 
             return jsonify({
-                'ticker': ticker,
-                'ohlcv': [
-                    {
-                        'timestamp': candle['timestamp'].isoformat(),
-                        'open': candle['open'],
-                        'high': candle['high'],
-                        'low': candle['low'],
-                        'close': candle['close'],
-                        'volume': candle['volume']
-                    }
-                    for candle in ohlcv
-                ] if ohlcv else []
+                'ticker': ticker._asdict() if ticker else None,
+                'ohlcv': ohlcv.to_records() if ohlcv else []
             })
         except Exception as e:
             logger.error(f"Error fetching market data: {e}")
@@ -256,10 +519,9 @@ def create_app(config):
         if trading_bot.running:
             return jsonify({'message': 'Bot already running'}), 200
 
-        # Start bot in a separate thread
-        thread = threading.Thread(target=trading_bot.start)
-        thread.daemon = True
-        thread.start()
+        # Tâche de fond du mode async de SocketIO: thread daemon en mode
+        # threading, greenlet sous eventlet/gevent
+        socketio.start_background_task(trading_bot.start)
 
         return jsonify({'message': 'Bot started'})
 
@@ -296,61 +558,26 @@ def create_app(config):
         if not trading_bot:
             return jsonify({'error': 'Bot not initialized'}), 500
 
-        db = get_db_session()
         try:
             # Replace URL format (BTC-USDT) back to exchange format (BTC/USDT)
             pair = pair.replace('-', '/')
 
             # Get OHLCV data (last 50 candles on 1h timeframe) - réduit pour performance
-            ohlcv = trading_bot.exchange.get_ohlcv(pair, timeframe='1h', limit=50)
+            # fetched in the background while the trades are read from the DB
+            ohlcv_future = _io_pool.submit(_get_ohlcv, pair, '1h', 50)
+
+            trade_markers = _get_trade_markers(pair)
+
+            ohlcv = ohlcv_future.result()
             if not ohlcv:
                 return jsonify({'error': 'Could not fetch OHLCV data'}), 500
 
-            # Get all trades for this pair (both open and closed)
-            trades = db.query(Trade).filter(
-                Trade.pair == pair
-            ).order_by(Trade.timestamp.asc()).all()
-
             # Get current position if exists
             position = trading_bot.risk_manager.get_position(pair)
 
-            # Format trades with entry/exit info
-            trade_markers = []
-            for trade in trades:
-                if trade.side == 'buy':
-                    trade_markers.append({
-                        'type': 'entry',
-                        'timestamp': trade.timestamp.isoformat(),
-                        'price': trade.price,
-                        'amount': trade.amount,
-                        'status': trade.status
-                    })
-                elif trade.side == 'sell':
-                    trade_markers.append({
-                        'type': 'exit',
-                        'timestamp': trade.timestamp.isoformat(),
-                        'price': trade.price,
-                        'amount': trade.amount,
-                        'profit_loss': trade.profit_loss,
-                        'profit_loss_percent': trade.profit_loss_percent
-                    })
-
-            # Format OHLCV
-            candles = [
-                {
-                    'timestamp': candle['timestamp'].isoformat(),
-                    'open': candle['open'],
-                    'high': candle['high'],
-                    'low': candle['low'],
-                    'close': candle['close'],
-                    'volume': candle['volume']
-                }
-                for candle in ohlcv
-            ]
-
             return jsonify({
                 'pair': pair,
-                'candles': candles,
+                'candles': ohlcv.to_records(),
                 'trades': trade_markers,
                 'position': position
             })
@@ -358,8 +585,6 @@ def create_app(config):
         except Exception as e:
             logger.error(f"Error fetching pair chart data: {e}", exc_info=True)
             return jsonify({'error': str(e)}), 500
-        finally:
-            db.close()
 
     @app.route('/api/live_pnl')
     def get_live_pnl():
@@ -368,54 +593,7 @@ def create_app(config):
             return jsonify({'error': 'Bot not initialized'}), 500
 
         try:
-            positions = trading_bot.risk_manager.get_open_positions()
-
-            total_pnl = 0
-            total_pnl_percent = 0
-            position_count = len(positions)
-
-            positions_data = []
-            for pos in positions:
-                # Fetch REAL-TIME price from exchange
-                pair = pos['pair']
-                try:
-                    ticker = trading_bot.exchange.get_ticker(pair)
-                    current_price = ticker['price'] if ticker else pos.get('current_price', pos['entry_price'])
-
-                    # Recalculate P&L with real-time price
-                    entry_price = pos['entry_price']
-                    amount = pos['amount']
-                    profit_loss = (current_price - entry_price) * amount
-                    profit_loss_percent = ((current_price / entry_price) - 1) * 100
-
-                except Exception as e:
-                    logger.warning(f"Could not fetch real-time price for {pair}: {e}")
-                    current_price = pos.get('current_price', pos['entry_price'])
-                    profit_loss = pos['profit_loss']
-                    profit_loss_percent = pos['profit_loss_percent']
-
-                total_pnl += profit_loss
-                positions_data.append({
-                    'pair': pair,
-                    'entry_price': pos['entry_price'],
-                    'current_price': current_price,
-                    'amount': amount,
-                    'profit_loss': profit_loss,
-                    'profit_loss_percent': profit_loss_percent,
-                    'stop_loss': pos.get('stop_loss'),
-                    'take_profit': pos.get('take_profit')
-                })
-
-            # Calculate average P&L percent
-            if position_count > 0:
-                total_pnl_percent = sum(p['profit_loss_percent'] for p in positions_data) / position_count
-
-            return jsonify({
-                'total_pnl': total_pnl,
-                'total_pnl_percent': total_pnl_percent,
-                'position_count': position_count,
-                'positions': positions_data
-            })
+            return jsonify(_get_live_pnl())
 
         except Exception as e:
             logger.error(f"Error fetching live P&L: {e}", exc_info=True)
@@ -509,3 +687,8 @@ def set_trading_bot(bot):
     """Set the global trading bot instance"""
     global trading_bot
     trading_bot = bot
+
+    # Les fills rendent obsolètes les prix mis en cache pour la paire
+    if bot is not None and hasattr(bot.exchange, 'add_fill_listener'):
+        bot.exchange.add_fill_listener(invalidate_market_cache)
+    invalidate_market_cache()
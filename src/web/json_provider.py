@@ -0,0 +1,70 @@
+"""
+orjson-backed JSON provider for the dashboard API.
+"""
+
+import decimal
+import uuid
+from itertools import islice
+from typing import Iterable, Iterator
+
+import orjson
+from flask.json.provider import JSONProvider
+
+# Naive datetimes are left without an offset (no OPT_NAIVE_UTC): candle and
+# trade timestamps are local/naive, and tagging them +00:00 would shift them
+_DUMPS_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    """Types orjson doesn't handle natively"""
+    if hasattr(obj, '_asdict'):  # NamedTuple records (Ticker, Candle, Order)
+        return obj._asdict()
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Encode responses with orjson (C encoder, writes bytes directly).
+
+    datetimes are serialized natively as ISO 8601, so routes can hand them
+    over without calling isoformat().
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        # Skip the bytes -> str -> bytes round trip of the base implementation
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS),
+            mimetype='application/json'
+        )
+
+
+def stream_json_array(items: Iterable, chunk_size: int = 100) -> Iterator[bytes]:
+    """
+    Encode ``items`` as a JSON array, ``chunk_size`` items at a time.
+
+    Meant for Response(stream_with_context(...)): only one chunk is held as
+    Python objects at once, and the client starts receiving before the last
+    row is read.
+    """
+    items = iter(items)
+    yield b'['
+    first = True
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            break
+        body = orjson.dumps(chunk, default=_default, option=_DUMPS_OPTIONS)[1:-1]
+        yield body if first else b',' + body
+        first = False
+    yield b']'
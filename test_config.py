@@ -5,6 +5,7 @@ Test script to verify configuration and API connectivity
 
 import os
 import sys
+from importlib.util import find_spec
 from dotenv import load_dotenv
 from colorama import init as colorama_init, Fore, Style
 
@@ -112,13 +113,11 @@ def check_dependencies():
 
     all_ok = True
     for package in required:
-        try:
-            if package == 'yaml':
-                __import__('yaml')
-            else:
-                __import__(package)
+        # find_spec locates the package without importing it (importing
+        # ccxt / pandas just to check they exist takes seconds)
+        if package in sys.modules or find_spec(package) is not None:
             print(f"{Fore.GREEN}✅ {package}{Style.RESET_ALL}")
-        except ImportError:
+        else:
             print(f"{Fore.RED}❌ {package} not installed{Style.RESET_ALL}")
             all_ok = False
 
@@ -0,0 +1,108 @@
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from src.utils.http_session import build_http_session
+
+RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: keep-alive\r\n\r\nok"
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        time.sleep(0.5)
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def _session():
+    session = build_http_session()
+    session.mount('http://', session.get_adapter('https://'))
+    return session
+
+
+def _read_request(conn):
+    data = b''
+    while b'\r\n\r\n' not in data:
+        chunk = conn.recv(4096)
+        if not chunk:
+            return False
+        data += chunk
+    return True
+
+
+@pytest.fixture
+def slow_server():
+    SlowHandler.hits = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def dropping_server():
+    """Answers one request per connection, then drops the kept-alive socket on the next"""
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    listener.listen()
+    hits = []
+
+    def serve():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            with conn:
+                if _read_request(conn):
+                    hits.append('served')
+                    conn.sendall(RESPONSE)
+                if _read_request(conn):
+                    hits.append('dropped')  # close without answering
+
+    threading.Thread(target=serve, daemon=True).start()
+    yield listener.getsockname()[1], hits
+    listener.close()
+
+
+def test_read_timeout_is_not_retried(slow_server):
+    url = f"http://127.0.0.1:{slow_server.server_address[1]}/"
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        _session().get(url, timeout=0.1)
+
+    assert SlowHandler.hits == 1
+
+
+def test_dropped_keep_alive_connection_is_retried(dropping_server):
+    port, hits = dropping_server
+    session = _session()
+    url = f"http://127.0.0.1:{port}/"
+
+    assert session.get(url, timeout=2).text == 'ok'
+    assert session.get(url, timeout=2).text == 'ok'  # reused socket dropped, then retried
+
+    assert hits == ['served', 'dropped', 'served']
+
+
+def test_dropped_connection_is_not_retried_for_post(dropping_server):
+    port, hits = dropping_server
+    session = _session()
+    url = f"http://127.0.0.1:{port}/"
+
+    session.get(url, timeout=2)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.post(url, data=b'order', timeout=2)
+
+    assert hits == ['served', 'dropped']